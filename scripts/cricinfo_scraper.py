@@ -18,11 +18,11 @@ Output structure: cricinfo/{format}_{gender}/{match_id}_{table}.parquet
 Strategy:
 1. Launch Chrome (headed via Xvfb in CI, or system Chrome locally) with playwright-stealth
 2. Navigate to ball-by-ball commentary page
-3. Extract SSR data from __NEXT_DATA__ (first ~20 balls + match metadata + innings)
-4. Scroll up/down to trigger IntersectionObserver pagination
-5. Capture API responses via page.on('response')
-6. Switch innings via dropdown and repeat
-7. Combine SSR + API data, deduplicate, save as parquet
+3. Read __NEXT_DATA__ once (first ~20 balls + match metadata + innings)
+4. Page every innings from the commentary API via in-page fetch(), in parallel
+5. Fallback: switch innings via dropdown and scroll to trigger pagination,
+   capturing API responses via page.on('response')
+6. Combine SSR + API data, deduplicate, save as parquet
 
 Usage:
   # CI (uses Playwright's bundled Chromium, run under xvfb-run):
@@ -43,11 +43,18 @@ import io
 import os
 import time
 import json
+import re
 import argparse
 import csv
 import signal
 import atexit
 import subprocess
+import threading
+import queue
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 sys.stdout = io.TextIOWrapper(
     sys.stdout.buffer, encoding="utf-8", errors="replace", line_buffering=True
@@ -56,54 +63,107 @@ sys.stderr = io.TextIOWrapper(
     sys.stderr.buffer, encoding="utf-8", errors="replace", line_buffering=True
 )
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
 from series_cache import build_series_list
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: stdlib json is a drop-in fallback
+    _json_loads = json.loads
+
 # ============================================================
 # Configuration — portable defaults relative to script location
 # ============================================================
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_OUTPUT = SCRIPT_DIR.parent / "cricinfo"
 DEFAULT_SERIES_LIST = SCRIPT_DIR / "series_list.csv"
+# Bound format of the match page URL: (series_slug, match_slug, match_id)
+_MATCH_URL = "https://www.espncricinfo.com/series/{}/{}-{}".format
 
 stealth = Stealth()
 
+# Per-page diagnostics (recovery, pagination, innings). Silent unless the
+# caller configures logging; main() routes it to stdout/stderr (--log-level).
+_log = logging.getLogger("cricinfo_scraper")
+_log.addHandler(logging.NullHandler())
+
+# Shared read-only defaults for missing JSON objects/arrays, so .get(...) or
+# fallbacks don't allocate a fresh {} / [] per row
+_EMPTY = MappingProxyType({})
+_EMPTY_LIST = ()
+
 # ============================================================
 # Chrome process cleanup — prevents orphaned browser instances
 # ============================================================
-# Global reference so signal/atexit handlers can close the browser
-_browser_ref = None
+# Global references so signal/atexit handlers can close every browser
+# (the main one plus any --workers browsers launched in worker threads)
+_browser_refs = []
+_browser_lock = threading.Lock()
 _pidfile_path = None
 
 
+# browser.close() can hang on a crashed/OOM renderer; force-kill after this long
+BROWSER_CLOSE_TIMEOUT_S = 10
+
+
+def _kill_pid_tree(pid):
+    """Force-kill a Chrome process (tree on Windows)."""
+    try:
+        if sys.platform == "win32":
+            # /F = force, /T = kill child process tree
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(pid)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        else:
+            os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Already exited after close()
+    except Exception as e:
+        print(f"  Cleanup: Chrome process kill failed: {e}", file=sys.stderr)
+
+
+def _kill_browser(browser):
+    """Close one Playwright browser, then kill its Chrome process tree as fallback."""
+    pid = browser.process.pid if hasattr(browser, 'process') and browser.process else None
+    # Watchdog: if close() hangs, kill the process so close() returns
+    watchdog = None
+    if pid:
+        watchdog = threading.Timer(BROWSER_CLOSE_TIMEOUT_S, _kill_pid_tree, args=(pid,))
+        watchdog.daemon = True
+        watchdog.start()
+    try:
+        browser.close()
+    except Exception as e:
+        print(f"  Cleanup: browser.close() failed: {e}", file=sys.stderr)
+    finally:
+        if watchdog:
+            watchdog.cancel()
+    # Kill the Chrome process tree directly as fallback
+    if pid:
+        _kill_pid_tree(pid)
+
+
 def _cleanup_browser():
-    """Kill the Playwright browser and remove PID file. Safe to call multiple times."""
-    global _browser_ref, _pidfile_path
-    browser = _browser_ref
-    _browser_ref = None  # Prevent re-entry
+    """Kill all registered Playwright browsers and remove PID file. Safe to call multiple times."""
+    global _pidfile_path
+    with _browser_lock:
+        browsers = list(_browser_refs)
+        _browser_refs.clear()  # Prevent re-entry
+    if not browsers and _pidfile_path is None:
+        return  # Already cleaned up (e.g. explicit call, then atexit)
 
-    if browser is not None:
-        try:
-            browser.close()
-        except Exception as e:
-            print(f"  Cleanup: browser.close() failed: {e}", file=sys.stderr)
-        # Kill the Chrome process tree directly as fallback
-        try:
-            pid = browser.process.pid if hasattr(browser, 'process') and browser.process else None
-            if pid:
-                if sys.platform == "win32":
-                    # /F = force, /T = kill child process tree
-                    subprocess.run(
-                        ["taskkill", "/F", "/T", "/PID", str(pid)],
-                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                    )
-                else:
-                    os.kill(pid, signal.SIGKILL)
-        except Exception as e:
-            print(f"  Cleanup: Chrome process kill failed: {e}", file=sys.stderr)
+    for browser in browsers:
+        _kill_browser(browser)
 
     # Remove PID file
     if _pidfile_path:
@@ -121,30 +181,105 @@ def _signal_handler(signum, frame):
     sys.exit(128 + signum)
 
 
-def _register_browser(browser, pidfile_dir=None):
-    """Register a browser for automatic cleanup on exit."""
-    global _browser_ref, _pidfile_path
-    _browser_ref = browser
+def _write_pidfile():
+    """Write python + Chrome PIDs so external tools can find and kill our browsers."""
+    if not _pidfile_path:
+        return
+    lines = [f"python_pid={os.getpid()}"]
+    for browser in _browser_refs:
+        chrome_pid = browser.process.pid if hasattr(browser, 'process') and browser.process else "unknown"
+        lines.append(f"chrome_pid={chrome_pid}")
+    try:
+        with open(_pidfile_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+    except Exception as e:
+        print(f"  Warning: Could not write PID file {_pidfile_path}: {e}", file=sys.stderr)
 
-    # Write PID file so external tools can find and kill our Chrome
-    if pidfile_dir:
-        _pidfile_path = str(Path(pidfile_dir) / f".cricinfo_scraper_{os.getpid()}.pid")
-        try:
-            chrome_pid = browser.process.pid if hasattr(browser, 'process') and browser.process else "unknown"
-            with open(_pidfile_path, "w") as f:
-                f.write(f"python_pid={os.getpid()}\nchrome_pid={chrome_pid}\n")
-        except Exception as e:
-            print(f"  Warning: Could not write PID file {_pidfile_path}: {e}", file=sys.stderr)
 
-    # Register cleanup handlers
+_handlers_installed = False
+
+
+def _install_handlers_once():
+    """Install atexit + SIGINT/SIGTERM cleanup handlers on first use only.
+
+    Signal handlers can only be set from the main thread, so a browser
+    registered first from a worker thread defers them to the next main-thread call.
+    """
+    global _handlers_installed
+    if _handlers_installed:
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
     atexit.register(_cleanup_browser)
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
+    _handlers_installed = True
+
+
+def _register_browser(browser, pidfile_dir=None):
+    """Register a browser for automatic cleanup on exit."""
+    global _pidfile_path
+    with _browser_lock:
+        _browser_refs.append(browser)
+        if pidfile_dir:
+            _pidfile_path = str(Path(pidfile_dir) / f".cricinfo_scraper_{os.getpid()}.pid")
+        _write_pidfile()
+    _install_handlers_once()
+
+
+def _unregister_browser(browser):
+    """Forget a browser that its owner has already closed."""
+    with _browser_lock:
+        if browser in _browser_refs:
+            _browser_refs.remove(browser)
+            _write_pidfile()
 
 # Page health check timeout (ms) — if a page.evaluate takes longer than this,
 # the page is likely crashed ("Aw, Snap!") or hung.
 PAGE_HEALTH_TIMEOUT_MS = 5000
 
+# Max wait (ms) for the innings dropdown to open after clicking its button.
+TIPPY_TIMEOUT_MS = 1500
+
+# Max wait (ms) for the commentary page an innings switch loads.
+INNINGS_SWITCH_TIMEOUT_MS = 5000
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to ``capacity``, then ``rate`` per second.
+
+    Shared by the main thread and --workers threads so the whole run stays
+    within one request budget. A rate of 0 disables limiting.
+    """
+
+    def __init__(self, capacity, rate):
+        self.configure(capacity, rate)
+        self._lock = threading.Lock()
+
+    def configure(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # Negative balance = we owe time; sleeping under the lock queues callers in order
+            if self._tokens < 0:
+                time.sleep(-self._tokens / self.rate)
+
+
+# Paces page loads, in-page API fetches and innings switches (see --rate)
+REQUEST_BURST = 10
+REQUEST_RATE = 1.0
+_bucket = TokenBucket(REQUEST_BURST, REQUEST_RATE)
+
 
 def _page_is_alive(page):
     """Quick check if the page is responsive (not crashed/hung)."""
@@ -155,34 +290,444 @@ def _page_is_alive(page):
         return False
 
 
+def _wait_for_next_data(page, timeout=PAGE_HEALTH_TIMEOUT_MS):
+    """Wait until __NEXT_DATA__ is in the DOM. Also proves the page is alive."""
+    try:
+        page.wait_for_function(
+            "() => document.getElementById('__NEXT_DATA__') !== null", timeout=timeout
+        )
+        return True
+    except Exception:
+        return False
+
+
 def _recover_page(page, url=None):
     """Attempt to recover a crashed/hung page via reload.
 
-    Returns True if recovery succeeded, False otherwise.
+    Returns True if recovery succeeded, False otherwise. Waits for the
+    reloaded page's __NEXT_DATA__, so callers can read it straight away.
     """
     try:
-        print("      Page unresponsive, attempting reload...")
+        _log.info("      Page unresponsive, attempting reload...")
         page.reload(wait_until="domcontentloaded", timeout=30000)
-        time.sleep(2)
-        if _page_is_alive(page):
-            print("      Page recovered after reload")
+        if _wait_for_next_data(page) or _page_is_alive(page):
+            _log.info("      Page recovered after reload")
             return True
     except Exception as e:
-        print(f"      Reload failed: {e}")
+        _log.warning(f"      Reload failed: {e}")
     # Last resort: navigate to the URL directly
     if url:
         try:
-            print("      Trying direct navigation...")
+            _log.info("      Trying direct navigation...")
             page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(2)
-            if _page_is_alive(page):
-                print("      Page recovered after navigation")
+            if _wait_for_next_data(page) or _page_is_alive(page):
+                _log.info("      Page recovered after navigation")
                 return True
         except Exception as e2:
-            print(f"      Direct navigation failed: {e2}")
+            _log.warning(f"      Direct navigation failed: {e2}")
     return False
 
 
+# ============================================================
+# In-page helpers — installed once per context via add_init_script so
+# page.evaluate calls send a one-line call instead of the whole function
+# source on every invocation. Non-enumerable to keep window scans clean.
+# ============================================================
+_PAGE_HELPERS_JS = """
+Object.defineProperty(window, '__cricinfo', {
+    value: {
+        // CleverTap overlays (removed), cookie/consent banners and Google
+        // DFP/GPT ad iframes and containers (hidden)
+        overlaySelector: '.wzrk-overlay, #wzrk_wrapper, [class*="wzrk"]',
+        bannerSelector: '[class*="cookie"], [class*="consent"], [id*="cookie"]',
+        adSelector: 'iframe[id^="google_ads"], iframe[src*="doubleclick"], ' +
+            '[id^="div-gpt-ad"], [class*="ad-slot"], [class*="ad-container"], ' +
+            '[data-ad-slot], [class*="sticky-ad"], [class*="adhesion"], ' +
+            '[class*="billboard"], [id*="adhesion"]',
+        dismissOverlays: () => {
+            const h = window.__cricinfo;
+            for (const el of document.querySelectorAll(h.overlaySelector)) el.remove();
+            for (const el of document.querySelectorAll(h.bannerSelector)) el.style.display = 'none';
+            for (const el of document.querySelectorAll(h.adSelector)) el.style.display = 'none';
+        },
+        // Jump to the page bottom (the commentary IntersectionObserver
+        // sentinel); with bounce, go to the top first and let a frame render
+        // so the observer sees the sentinel leave and re-enter the viewport
+        scrollToEnd: async (bounce) => {
+            const root = document.scrollingElement || document.body;
+            if (bounce) {
+                window.scrollTo(0, 0);
+                await new Promise(r => setTimeout(r, 100));
+            }
+            window.scrollTo(0, root.scrollHeight);
+        },
+        // Team abbreviation button on limited-overs pages (e.g. 'PAK')
+        abbrButtonRe: /^[A-Z][A-Z0-9-]{1,7}$/,
+        // One pass over the buttons: a Test 'Innings' label wins outright,
+        // the first abbreviation button is kept as the fallback. Rects are
+        // only measured once the cheap text test passes.
+        findAndClickInningsButton: () => {
+            const abbrRe = window.__cricinfo.abbrButtonRe;
+            let fallback = null;
+            for (const btn of document.querySelectorAll('button')) {
+                const text = btn.innerText.trim();
+                if (text.includes('Innings')) {
+                    const rect = btn.getBoundingClientRect();
+                    if (rect.height > 10 && rect.width > 30) {
+                        btn.click();
+                        return { text, style: 'test' };
+                    }
+                } else if (!fallback && abbrRe.test(text)) {
+                    const rect = btn.getBoundingClientRect();
+                    if (rect.height > 15 && rect.width > 30) fallback = { btn, text };
+                }
+            }
+            if (!fallback) return null;
+            fallback.btn.click();
+            return { text: fallback.text, style: 'limited' };
+        },
+        // Dismiss overlays, bring the innings button into view, open the
+        // dropdown and either list its items or click the target one
+        inningsOp: async (op, target, tippyTimeout) => {
+            const h = window.__cricinfo;
+            const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+            // Next rendered frame (timer fallback if rAF is throttled)
+            const frame = () => new Promise(r => {
+                requestAnimationFrame(() => r());
+                setTimeout(r, 100);
+            });
+            // Poll for a condition instead of sleeping a fixed interval
+            const poll = async (fn, timeout) => {
+                const deadline = Date.now() + timeout;
+                let v;
+                while (!(v = fn())) {
+                    if (Date.now() > deadline) return null;
+                    await sleep(50);
+                }
+                return v;
+            };
+            if (op === 'switch') {
+                window.scrollTo(0, 0);
+                await frame();
+            }
+            window.scrollTo(0, 500);
+            await frame();
+            const btn = await poll(() => h.findAndClickInningsButton(), tippyTimeout);
+            if (!btn) return { error: 'no_button' };
+            if (!await poll(() => document.querySelector('.tippy-box li[title]'), tippyTimeout)) {
+                return { error: 'no_tippy' };
+            }
+            if (op === 'switch') return { clicked: h.clickInningsItem(target) };
+            const titles = [];
+            for (const li of document.querySelectorAll('.tippy-box li[title]')) {
+                const title = (li.getAttribute('title') || '').trim();
+                if (title) titles.push(title);
+            }
+            return { current: btn.text, titles };
+        },
+        // Exact (normalized) title match wins; a substring match either way
+        // is only trusted when it is the sole candidate, so 'India' never
+        // picks 'India A' (or 'Australia' 'Australia Women')
+        clickInningsItem: (target) => {
+            const tippy = document.querySelector('.tippy-box');
+            if (!tippy) return 'no_tippy';
+            const norm = (s) => s.replace(/\s+/g, ' ').trim().toLowerCase();
+            const want = norm(target);
+            let hit = null;
+            const partial = [];
+            for (const li of tippy.querySelectorAll('li[title]')) {
+                const title = norm(li.getAttribute('title') || '');
+                if (!title) continue;
+                if (title === want) { hit = li; break; }
+                if (title.includes(want) || want.includes(title)) partial.push(li);
+            }
+            if (!hit && partial.length === 1) hit = partial[0];
+            if (!hit) return 'not_found';
+            const div = hit.querySelector('div');
+            if (div) div.click();
+            else hit.click();
+            return 'ok';
+        },
+        // Flat fixture rows (FIXTURE_COLUMNS minus series-level tags) from a
+        // schedule page's __NEXT_DATA__; slug/teams are for the scrape queue
+        scheduleRows: (nd) => {
+            const data = nd?.props?.appPageProps?.data || {};
+            if (data.statusCode === 404) return { error: 404 };
+            const series = data.series || {};
+            return {
+                ok: true,
+                stub: !('content' in data),
+                series: {
+                    longName: series.longName || '',
+                    name: series.name || '',
+                    slug: series.slug || '',
+                    gender: series.gender || '',
+                },
+                matches: (data.content?.matches || []).map(m => {
+                    const t1 = (m.teams || [])[0]?.team || {};
+                    const t2 = (m.teams || [])[1]?.team || {};
+                    return {
+                        match_id: String(m.objectId || m.id || ''),
+                        status: m.state || '',
+                        start_date: m.startDate || '',
+                        start_time: m.startTime || '',
+                        title: m.title || '',
+                        team1: t1.longName || '',
+                        team1_abbrev: t1.abbreviation || '',
+                        team2: t2.longName || '',
+                        team2_abbrev: t2.abbreviation || '',
+                        venue: m.ground?.name || '',
+                        country: m.ground?.country?.name || '',
+                        status_text: m.statusText || '',
+                        winner_team_id: m.winnerTeamId ? String(m.winnerTeamId) : '',
+                        slug: m.slug || '',
+                        teams: (m.teams || []).map(t => t.team?.abbreviation || '?'),
+                    };
+                }),
+            };
+        },
+        // scheduleRows for the currently loaded page
+        scheduleFromPage: () => {
+            const el = document.getElementById('__NEXT_DATA__');
+            if (!el) return null;
+            return window.__cricinfo.scheduleRows(JSON.parse(el.textContent));
+        },
+        // Raw __NEXT_DATA__ text of a same-origin page, fetched without
+        // rendering it (null on HTTP error, block page or missing payload)
+        fetchNextData: async (url) => {
+            try {
+                const resp = await fetch(url, { credentials: 'include' });
+                if (!resp.ok) return null;
+                const html = await resp.text();
+                const match = html.match(/<script id="__NEXT_DATA__"[^>]*>([\\s\\S]*?)<\\/script>/);
+                return match ? match[1] : null;
+            } catch (e) {
+                return null;
+            }
+        },
+        // scheduleRows for a schedule URL, fetched without navigating
+        fetchSchedule: async (url) => {
+            try {
+                const resp = await fetch(url);
+                if (!resp.ok) return { error: resp.status };
+                const html = await resp.text();
+                const match = html.match(/<script id="__NEXT_DATA__"[^>]*>([\\s\\S]*?)<\\/script>/);
+                if (!match) return { error: 'no_next_data' };
+                return window.__cricinfo.scheduleRows(JSON.parse(match[1]));
+            } catch (e) {
+                return { error: e.message };
+            }
+        },
+        // fetchSchedule for several URLs, at most maxParallel in flight;
+        // results come back in input order
+        fetchSchedules: async ([urls, maxParallel]) => {
+            const results = new Array(urls.length);
+            let next = 0;
+            const worker = async () => {
+                while (next < urls.length) {
+                    const i = next++;
+                    results[i] = await window.__cricinfo.fetchSchedule(urls[i]);
+                }
+            };
+            await Promise.all(
+                Array.from({ length: Math.min(maxParallel, urls.length) }, worker)
+            );
+            return results;
+        },
+        // One commentary page per step, all steps concurrently. Python drives
+        // the rounds so every page costs one rate-limiter token; a step's
+        // error (HTTP status or a non-JSON body) never hides the others
+        fetchCommentsRound: async ([apiUrl, steps]) => {
+            const one = async (step) => {
+                let url = `${apiUrl}&inningNumber=${step.inning}`;
+                if (step.over != null) url += `&fromInningOver=${step.over}`;
+                try {
+                    const r = await fetch(url, { credentials: 'include' });
+                    if (!r.ok) return { error: `HTTP ${r.status}` };
+                    const j = await r.json();
+                    return { page: { comments: j.comments || [], nextInningOver: j.nextInningOver } };
+                } catch (e) {
+                    return { error: e.message };
+                }
+            };
+            return Promise.all(steps.map(one));
+        },
+    },
+    enumerable: false,
+});
+
+// Strip overlays as they are inserted instead of re-scanning before every
+// interaction. Only added subtrees are checked; a full dismissOverlays
+// pass runs when one of them contains an overlay, banner or ad.
+(() => {
+    const h = window.__cricinfo;
+    const any = [h.overlaySelector, h.bannerSelector, h.adSelector].join(', ');
+    const watch = () => {
+        h.dismissOverlays();
+        new MutationObserver((records) => {
+            for (const r of records) {
+                for (const node of r.addedNodes) {
+                    if (node.nodeType === 1 && (node.matches(any) || node.querySelector(any))) {
+                        h.dismissOverlays();
+                        return;
+                    }
+                }
+            }
+        }).observe(document.documentElement, { childList: true, subtree: true });
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', watch, { once: true });
+    } else {
+        watch();
+    }
+})();
+"""
+
+
+# Ad/analytics hosts whose overlays dismissOverlays strips anyway; aborting
+# them saves the connections and bytes on every match page load
+_BLOCKED_HOSTS_RE = re.compile(
+    r"^https?://([^/]*\.)?("
+    r"doubleclick\.net|googlesyndication\.com|googletagservices\.com|"
+    r"googletagmanager\.com|google-analytics\.com|amazon-adsystem\.com|"
+    r"clevertap\.com|clevertap-prod\.com|wzrk\.co|wzrkt\.com|"
+    r"scorecardresearch\.com"
+    r")/"
+)
+# Images, fonts and media are never read (everything comes from __NEXT_DATA__
+# and the comments API). Matched on URL so Playwright filters in the browser
+# rather than sending every request through a Python handler. Stylesheets
+# stay: the innings dropdown fallback needs real layout to find its button.
+_BLOCKED_ASSETS_RE = re.compile(
+    r"\.(png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|mp4|webm|m3u8)(\?|$)",
+    re.IGNORECASE,
+)
+
+
+def _new_context(browser):
+    """Create a stealth browser context with the scraper's standard settings.
+
+    Service workers are blocked so Cricinfo's offline cache cannot pin
+    responses in memory across the hundreds of matches a context serves.
+    Ad/analytics hosts and image/font/media assets are aborted (see
+    _BLOCKED_HOSTS_RE, _BLOCKED_ASSETS_RE).
+    """
+    context = browser.new_context(
+        viewport={"width": 1280, "height": 900},
+        locale="en-US",
+        service_workers="block",
+    )
+    stealth.apply_stealth_sync(context)
+    context.add_init_script(_PAGE_HELPERS_JS)
+    context.route(_BLOCKED_HOSTS_RE, lambda route: route.abort())
+    context.route(_BLOCKED_ASSETS_RE, lambda route: route.abort())
+    return context
+
+
+# Akamai retries reuse one spare context per browser instead of building a
+# fresh stealth context for every blocked match
+RETRY_CONTEXT_MAX_USES = 20
+_retry_contexts = {}  # browser -> [context, page, uses]
+
+
+def _get_retry_page(browser):
+    """Page in the browser's shared retry context, recycled every RETRY_CONTEXT_MAX_USES."""
+    entry = _retry_contexts.get(browser)
+    if entry is not None and entry[2] >= RETRY_CONTEXT_MAX_USES:
+        _close_retry_context(browser)
+        entry = None
+    if entry is None:
+        context = _new_context(browser)
+        entry = _retry_contexts[browser] = [context, context.new_page(), 0]
+    entry[2] += 1
+    return entry[1]
+
+
+def _close_retry_context(browser):
+    """Close the browser's retry context (if any) so the next retry starts fresh."""
+    entry = _retry_contexts.pop(browser, None)
+    if entry is not None:
+        try:
+            entry[0].close()
+        except Exception:
+            pass
+
+
+def _release_page(page):
+    """Navigate to about:blank so the previous match's DOM and JS heap are freed.
+
+    The scraper reuses one tab across many matches; without this the
+    renderer keeps the last (multi-MB) match page alive until the next goto.
+    Returns False if the tab could not be navigated (crashed or closed).
+    """
+    try:
+        page.goto("about:blank", timeout=10000)
+        return True
+    except Exception as e:
+        print(f"  Warning: could not release page: {e}", file=sys.stderr)
+        return False
+
+
+def _replace_page(context, page):
+    """Swap a dead tab for a fresh one in the same context."""
+    try:
+        page.close()
+    except Exception:
+        pass
+    return context.new_page()
+
+
+# One raw CDP session per page for _raw_eval; dropped with the page
+_cdp_sessions = weakref.WeakKeyDictionary()
+
+
+def _raw_eval(page, expression, await_promise=False):
+    """Evaluate a JS expression via CDP Runtime.evaluate, returning its value.
+
+    For hot, data-only reads: skips page.evaluate's function wrapping and
+    argument/result serialization layer. Falls back to page.evaluate if a
+    CDP session cannot be opened.
+    """
+    cdp = _cdp_sessions.get(page)
+    if cdp is None:
+        try:
+            cdp = _cdp_sessions[page] = page.context.new_cdp_session(page)
+        except Exception:
+            return page.evaluate(expression)
+    resp = cdp.send("Runtime.evaluate", {
+        "expression": expression,
+        "returnByValue": True,
+        "awaitPromise": await_promise,
+    })
+    if "exceptionDetails" in resp:
+        details = resp["exceptionDetails"]
+        raise Exception((details.get("exception") or details).get("description")
+                        or details.get("text", "evaluate failed"))
+    return resp["result"].get("value")
+
+
+def _read_next_data(page):
+    """Return the page's parsed __NEXT_DATA__, or None if it has none.
+
+    Only the raw JSON text crosses CDP (one round-trip); it is parsed here
+    with orjson when installed.
+    """
+    nd_text = _raw_eval(
+        page, "document.getElementById('__NEXT_DATA__')?.textContent ?? null"
+    )
+    return _json_loads(nd_text) if nd_text else None
+
+
+def _page_data(next_data):
+    """props.appPageProps.data of a __NEXT_DATA__ dict (raises if missing)."""
+    return next_data["props"]["appPageProps"]["data"]
+
+
+def _first(items):
+    """First element of a possibly-null list, else None."""
+    return items[0] if items else None
+
+
 ERROR_LOG_COLUMNS = [
     "timestamp", "match_id", "series_id", "series_name", "format",
     "teams", "innings_expected", "innings_scraped", "failed_innings",
@@ -190,36 +735,80 @@ ERROR_LOG_COLUMNS = [
 ]
 
 
+_error_log_lock = threading.Lock()
+# Open handle to scrape_errors.csv, kept for the whole run (see log_scrape_error)
+_error_log = {"path": None, "fh": None, "writer": None, "pending": 0}
+ERROR_LOG_FLUSH_EVERY = 20
+
+
+def _close_error_log():
+    """Flush and close the error log handle. Safe to call multiple times."""
+    # Timeout: a signal can land while this thread holds the lock mid-write
+    locked = _error_log_lock.acquire(timeout=5)
+    try:
+        if _error_log["fh"] is not None:
+            try:
+                _error_log["fh"].close()
+            except Exception as e:
+                print(f"  Warning: could not close error log: {e}", file=sys.stderr)
+        _error_log.update(path=None, fh=None, writer=None, pending=0)
+    finally:
+        if locked:
+            _error_log_lock.release()
+
+
+atexit.register(_close_error_log)
+
+
 def log_scrape_error(output_dir, **kwargs):
-    """Append one row to cricinfo/scrape_errors.csv."""
+    """Append one row to cricinfo/scrape_errors.csv.
+
+    The file is opened once and rows are buffered, flushed every
+    ERROR_LOG_FLUSH_EVERY rows and at exit.
+    """
     log_path = Path(output_dir) / "scrape_errors.csv"
-    write_header = not log_path.exists()
-    with open(log_path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=ERROR_LOG_COLUMNS)
-        if write_header:
-            writer.writeheader()
-        row = {col: kwargs.get(col, "") for col in ERROR_LOG_COLUMNS}
-        writer.writerow(row)
+    with _error_log_lock:  # --workers threads share the log file
+        if _error_log["path"] != log_path:
+            if _error_log["fh"] is not None:
+                _error_log["fh"].close()
+            write_header = not log_path.exists()
+            fh = open(log_path, "a", newline="", encoding="utf-8")
+            writer = csv.writer(fh)
+            if write_header:
+                writer.writerow(ERROR_LOG_COLUMNS)
+            _error_log.update(path=log_path, fh=fh, writer=writer, pending=0)
+        _error_log["writer"].writerow([kwargs.get(col, "") for col in ERROR_LOG_COLUMNS])
+        _error_log["pending"] += 1
+        if _error_log["pending"] >= ERROR_LOG_FLUSH_EVERY:
+            _error_log["fh"].flush()
+            _error_log["pending"] = 0
+
+
+# Women's-cricket hints in series names/slugs (one case-insensitive regex
+# pass, not N substring scans over a lowercased copy)
+_FEMALE_RE = re.compile(r"women|female|wbbl|wpl|wodi|wt20", re.IGNORECASE)
 
 
 def _detect_gender_from_series(series_obj, name=""):
     """Detect gender from series __NEXT_DATA__ object or name."""
     # Direct field (most reliable)
-    gender = series_obj.get("gender", "")
-    if gender and gender.lower() in ("male", "female"):
-        return gender.lower()
+    gender = (series_obj.get("gender") or "").lower()
+    if gender in ("male", "female"):
+        return gender
     # Slug check
     slug = series_obj.get("slug", "")
     if "women" in slug.lower():
         return "female"
     # Name heuristic
-    if name:
-        lower = name.lower()
-        if any(kw in lower for kw in ("women", "female", "wbbl", "wpl", "wodi", "wt20")):
-            return "female"
+    if name and _FEMALE_RE.search(name):
+        return "female"
     return None
 
 
+# Schedule pages fetched concurrently from one page in --fixtures-only
+FIXTURE_FETCH_PARALLEL = 4
+
+
 def fetch_fixtures_fast(page, series_url, series_id, series_name="",
                        series_format="", series_gender=""):
     """Fetch fixtures using in-browser fetch() — no page navigation needed.
@@ -230,99 +819,92 @@ def fetch_fixtures_fast(page, series_url, series_id, series_name="",
 
     Returns list of fixture dicts (same schema as discover_matches all_fixtures).
     """
-    url = series_url + "/match-schedule-fixtures-and-results"
+    return fetch_fixtures_batch(
+        page, [(series_url, series_id, series_name, series_format, series_gender)]
+    )[0]
 
-    # JavaScript that fetches the page HTML and extracts __NEXT_DATA__
-    JS_FETCH = """
-        async (url) => {
-            try {
-                const resp = await fetch(url);
-                if (!resp.ok) return { error: resp.status };
-                const html = await resp.text();
-                const match = html.match(/<script id="__NEXT_DATA__"[^>]*>([\\s\\S]*?)<\\/script>/);
-                if (!match) return { error: 'no_next_data' };
-                const nd = JSON.parse(match[1]);
-                const data = nd?.props?.appPageProps?.data || {};
-                if (data.statusCode === 404) return { error: 404 };
-                const matches = data?.content?.matches || [];
-                const series = data?.series || {};
-                return {
-                    matches: matches.map(m => ({
-                        id: String(m.objectId || m.id || ''),
-                        state: m.state || '',
-                        title: m.title || '',
-                        startDate: m.startDate || '',
-                        startTime: m.startTime || '',
-                        statusText: m.statusText || '',
-                        teams: (m.teams || []).map(t => ({
-                            name: t.team?.longName || '',
-                            abbrev: t.team?.abbreviation || ''
-                        })),
-                        ground: m.ground?.name || '',
-                        country: m.ground?.country?.name || '',
-                        winnerId: m.winnerTeamId ? String(m.winnerTeamId) : ''
-                    })),
-                    seriesName: series.longName || series.name || '',
-                    seriesSlug: series.slug || '',
-                    ok: true
-                };
-            } catch (e) {
-                return { error: e.message };
-            }
-        }
+
+def fetch_fixtures_batch(page, requests):
+    """fetch_fixtures_fast for several series in one evaluate.
+
+    requests is a list of (series_url, series_id, series_name, series_format,
+    series_gender) tuples; up to FIXTURE_FETCH_PARALLEL schedule fetches are
+    in flight at once. Returns one fixture list per request, in order ([] for
+    a series that failed).
     """
+    urls = [req[0] + "/match-schedule-fixtures-and-results" for req in requests]
 
     try:
-        result = page.evaluate(JS_FETCH, url)
+        for _ in urls:
+            _bucket.acquire()
+        results = page.evaluate(
+            "(args) => window.__cricinfo.fetchSchedules(args)",
+            [urls, FIXTURE_FETCH_PARALLEL],
+        )
     except Exception as e:
-        print(f"  Warning: fetch_fixtures_fast failed for {url}: {e}", file=sys.stderr)
-        return []
+        print(f"  Warning: fetch_fixtures_fast failed for {len(urls)} series: {e}", file=sys.stderr)
+        return [[] for _ in urls]
+
+    return [
+        _schedule_fixtures(result, *req[1:])
+        for req, result in zip(requests, results)
+    ]
+
 
+def _schedule_fixtures(result, series_id, series_name, series_format, series_gender):
+    """Fixture dicts from one fetchSchedule result ([] on error)."""
     if not result or not result.get("ok"):
         error_detail = result.get("error", "unknown") if result else "null_result"
-        print(f"  Warning: fetch_fixtures_fast error for series: {error_detail}", file=sys.stderr)
+        print(f"  Warning: fetch_fixtures_fast error for series {series_id}: {error_detail}", file=sys.stderr)
         return []
 
     # Detect gender from page data
-    page_name = result.get("seriesName", "")
-    page_slug = result.get("seriesSlug", "")
+    series_obj = result["series"]
+    page_name = series_obj["longName"] or series_obj["name"]
     s_name = series_name or page_name
     s_gender = series_gender
     if not s_gender or s_gender == "male":
         # Check page data for gender hints
-        combined = (page_name + " " + page_slug).lower()
-        if any(kw in combined for kw in ("women", "female", "wbbl", "wpl")):
+        if _FEMALE_RE.search(f"{page_name} {series_obj['slug']}"):
             s_gender = "female"
     s_gender = s_gender or "male"
 
-    fixtures = []
-    for m in result["matches"]:
-        if not m["id"]:
+    return [
+        fixture for fixture, _ in _iter_schedule_matches(
+            result["matches"], str(series_id), s_name, series_format, s_gender,
+            series_obj["slug"],
+        )
+    ]
+
+
+def _iter_schedule_matches(rows, series_id, s_name, s_format, s_gender, series_slug):
+    """Tag in-page scheduleRows rows with series fields.
+
+    Yields (fixture, scrape_entry) per match; scrape_entry is None unless the
+    match is finished. series_id must already be a str.
+    """
+    for row in rows:
+        match_id = row["match_id"]
+        if not match_id:
             continue
-        teams = m.get("teams", [])
-        team1 = teams[0] if len(teams) > 0 else {}
-        team2 = teams[1] if len(teams) > 1 else {}
-        fixtures.append({
-            "match_id": m["id"],
-            "series_id": str(series_id),
-            "series_name": s_name,
-            "format": series_format,
-            "gender": s_gender,
-            "status": m["state"],
-            "start_date": m.get("startDate", ""),
-            "start_time": m.get("startTime", ""),
-            "title": m.get("title", ""),
-            "team1": team1.get("name", ""),
-            "team1_abbrev": team1.get("abbrev", ""),
-            "team2": team2.get("name", ""),
-            "team2_abbrev": team2.get("abbrev", ""),
-            "venue": m.get("ground", ""),
-            "country": m.get("country", ""),
-            "status_text": m.get("statusText", ""),
-            "winner_team_id": m.get("winnerId", ""),
-        })
-
-    return fixtures
+        slug = row.pop("slug")
+        teams = row.pop("teams")
+        row["series_id"] = series_id
+        row["series_name"] = s_name
+        row["format"] = s_format
+        row["gender"] = s_gender
+
+        scrape_entry = None
+        if row["status"] in ("FINISHED", "POST"):
+            scrape_entry = {
+                "match_id": match_id,
+                "slug": slug,
+                "series_slug": series_slug,
+                "series_id": series_id,
+                "title": row["title"],
+                "teams": teams,
+            }
+        yield row, scrape_entry
 
 
 def discover_matches(page, series_id, series_url=None, series_name=None,
@@ -338,67 +920,39 @@ def discover_matches(page, series_id, series_url=None, series_name=None,
         series_url = f"https://www.espncricinfo.com/series/{series_id}"
     url = series_url + "/match-schedule-fixtures-and-results"
 
-    nd = None
+    schedule = None
     try:
+        _bucket.acquire()
         page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(1.5)
 
-        # Recover if page crashed during navigation
-        if not _page_is_alive(page):
+        # Ready = SSR data present; otherwise recover if the page crashed
+        if not _wait_for_next_data(page) and not _page_is_alive(page):
             if not _recover_page(page, url):
                 return [], []
-            time.sleep(1.5)
 
-        nd_text = page.evaluate(
-            """
-            () => {
-                const el = document.getElementById('__NEXT_DATA__');
-                return el ? el.textContent : null;
-            }
-        """
-        )
-        if nd_text:
-            nd = json.loads(nd_text)
-            # Check if the page actually has series data (not a stub)
-            data_check = nd.get("props", {}).get("appPageProps", {}).get("data", {})
-            if "content" not in data_check:
-                nd = None  # Stub page
+        schedule = _read_schedule(page)
     except Exception as e:
         err_msg = str(e)
         # Navigation interrupted = redirect, try waiting for final page
         if "interrupted" in err_msg.lower():
             try:
                 page.wait_for_load_state("domcontentloaded", timeout=10000)
-                time.sleep(1.5)
-                nd_text = page.evaluate("""
-                    () => {
-                        const el = document.getElementById('__NEXT_DATA__');
-                        return el ? el.textContent : null;
-                    }
-                """)
-                if nd_text:
-                    nd = json.loads(nd_text)
-                    data_check = nd.get("props", {}).get("appPageProps", {}).get("data", {})
-                    if "content" not in data_check:
-                        nd = None
+                _wait_for_next_data(page)
+                schedule = _read_schedule(page)
             except Exception as inner_e:
                 print(f"    Error recovering from redirect: {inner_e} (original: {e})", file=sys.stderr)
         else:
             print(f"    Error loading schedule page: {e}")
 
-    if nd is None:
+    if schedule is None:
         print(f"    No schedule data found")
         return [], []
 
     try:
-        data = nd.get("props", {}).get("appPageProps", {}).get("data", {})
-        content = data.get("content", {})
-        series_obj = data.get("series", {})
-        matches_raw = content.get("matches", [])
-
-        series_slug = series_obj.get("slug", "")
+        series_obj = schedule["series"]
+        series_slug = series_obj["slug"]
         # Use series-level metadata, with page data as override
-        s_name = series_name or series_obj.get("longName") or series_obj.get("name") or ""
+        s_name = series_name or series_obj["longName"] or series_obj["name"]
         s_format = series_format or ""
         # Detect gender from page data (more reliable than CSV)
         page_gender = _detect_gender_from_series(series_obj, s_name)
@@ -406,57 +960,12 @@ def discover_matches(page, series_id, series_url=None, series_name=None,
 
         finished_matches = []
         all_fixtures = []
-
-        for m in matches_raw:
-            match_id = m.get("objectId") or m.get("id")
-            if not match_id:
-                continue
-            match_id = str(match_id)
-            state = m.get("state", "")
-            slug = m.get("slug", "")
-
-            teams_raw = m.get("teams", [])
-            team1 = teams_raw[0].get("team", {}) if len(teams_raw) > 0 else {}
-            team2 = teams_raw[1].get("team", {}) if len(teams_raw) > 1 else {}
-
-            ground = m.get("ground") or {}
-            country = ground.get("country") or {}
-
-            # Build fixture entry (all states)
-            fixture = {
-                "match_id": match_id,
-                "series_id": str(series_id),
-                "series_name": s_name,
-                "format": s_format,
-                "gender": s_gender,
-                "status": state,
-                "start_date": m.get("startDate", ""),
-                "start_time": m.get("startTime", ""),
-                "title": m.get("title", ""),
-                "team1": team1.get("longName", ""),
-                "team1_abbrev": team1.get("abbreviation", ""),
-                "team2": team2.get("longName", ""),
-                "team2_abbrev": team2.get("abbreviation", ""),
-                "venue": ground.get("name", ""),
-                "country": country.get("name", ""),
-                "status_text": m.get("statusText", ""),
-                "winner_team_id": str(m.get("winnerTeamId", "")) if m.get("winnerTeamId") else "",
-            }
+        for fixture, scrape_entry in _iter_schedule_matches(
+            schedule["matches"], str(series_id), s_name, s_format, s_gender, series_slug
+        ):
             all_fixtures.append(fixture)
-
-            # Build scraping entry (finished only)
-            if state in ("FINISHED", "POST"):
-                finished_matches.append({
-                    "match_id": match_id,
-                    "slug": slug,
-                    "series_slug": series_slug,
-                    "series_id": str(series_id),
-                    "title": m.get("title", ""),
-                    "teams": [
-                        t.get("team", {}).get("abbreviation", "?")
-                        for t in teams_raw
-                    ],
-                })
+            if scrape_entry is not None:
+                finished_matches.append(scrape_entry)
 
         return finished_matches, all_fixtures
     except Exception as e:
@@ -464,8 +973,44 @@ def discover_matches(page, series_id, series_url=None, series_name=None,
         return [], []
 
 
-def scrape_match_commentary(browser, context, page, match_url, max_innings=2):
-    """Scrape all ball-by-ball data for a match using scroll-based pagination.
+def _read_schedule(page):
+    """Flattened schedule rows for the loaded page, or None if it has no series data."""
+    schedule = page.evaluate("() => window.__cricinfo.scheduleFromPage()")
+    if not schedule or not schedule.get("ok") or schedule.get("stub"):
+        return None  # No __NEXT_DATA__, 404, or an ID-only stub page
+    return schedule
+
+
+def _is_comments_response(response):
+    """True for the commentary API responses the match page paginates with."""
+    return "hs-consumer-api" in response.url and "/comments" in response.url
+
+
+def _response_json(response):
+    """Parse a response body straight from bytes (orjson when installed)."""
+    return _json_loads(response.body())
+
+
+def _comments_page(response):
+    """A captured commentary response cut down to what pagination keeps.
+
+    Only ball comments and the next-page cursor are held, so a long innings
+    does not pin every full API body (and its non-ball entries) in memory.
+    """
+    body = _response_json(response)
+    return {
+        "comments": [c for c in body.get("comments") or _EMPTY_LIST
+                     if c.get("overNumber") is not None],
+        "nextInningOver": body.get("nextInningOver"),
+    }
+
+
+def scrape_match_commentary(browser, context, page, match_url, max_innings=2,
+                            fetch_html=False):
+    """Scrape all ball-by-ball data for a match, paging the commentary API in-page.
+
+    With fetch_html, the page's SSR HTML is fetched in-page first (see
+    _scrape_match_fetched); the full page load only runs if that falls short.
 
     Returns dict with:
         balls: list of ball dicts (hawkeye or basic)
@@ -479,129 +1024,156 @@ def scrape_match_commentary(browser, context, page, match_url, max_innings=2):
         innings_scraped: int - number of innings with captured ball data
         innings_failures: list of dicts - details of innings that failed to scrape
     """
+    full_url = match_url + "/ball-by-ball-commentary"
+    if fetch_html:
+        result = _scrape_match_fetched(page, full_url, max_innings)
+        if result is not None:
+            return result
+        _log.info("      (HTML fetch fell short - loading the page)")
 
-    # Set up response interceptor
+    # Set up response interceptor. ``capture`` is cleared while the page
+    # fetches commentary itself (in-page fetch), so those bodies aren't also
+    # read and parsed here only to be discarded
     api_responses = []
+    capture = threading.Event()
+    capture.set()
 
     def on_response(response):
-        if "hs-consumer-api" in response.url and "/comments" in response.url:
+        if capture.is_set() and _is_comments_response(response):
             try:
-                body = response.json()
-                api_responses.append(body)
+                api_responses.append(_comments_page(response))
             except Exception as exc:
-                print(
-                    f"  Warning: Failed to parse API response: {exc}", file=sys.stderr
-                )
+                _log.warning(f"  Warning: Failed to parse API response: {exc}")
+
+    # Renderer crash (e.g. OOM "Aw, Snap!"): flag it so pagination stops
+    # at once instead of scrolling a dead tab
+    crashed = threading.Event()
+
+    def on_crash(_page):
+        crashed.set()
 
     page.on("response", on_response)
+    page.on("crash", on_crash)
+
+    def detach():
+        page.remove_listener("response", on_response)
+        page.remove_listener("crash", on_crash)
 
-    full_url = match_url + "/ball-by-ball-commentary"
     try:
+        _bucket.acquire()
         page.goto(full_url, wait_until="domcontentloaded", timeout=30000)
-        time.sleep(1.5)
     except Exception as e:
         # Page may have crashed — try recovery before giving up
         if _recover_page(page, full_url):
-            time.sleep(1.5)
+            crashed.clear()
         else:
-            page.remove_listener("response", on_response)
+            detach()
             raise e
 
-    # Check page is alive before reading title (crash screen has no useful title)
-    if not _page_is_alive(page):
+    # Ready = SSR data present. Otherwise check the page is alive before reading
+    # the title (crash screen has no useful title; a block page has no SSR data)
+    if not _wait_for_next_data(page) and not _page_is_alive(page):
         if not _recover_page(page, full_url):
-            page.remove_listener("response", on_response)
+            detach()
             raise Exception("Page crashed and could not be recovered")
-        time.sleep(1.5)
+        crashed.clear()
 
     title = page.title()
     if "access denied" in title.lower():
-        page.remove_listener("response", on_response)
+        detach()
         # Retry once with a fresh context
-        print(f"      Akamai block detected, retrying with fresh context...")
-        context2 = None
+        _log.warning(f"      Akamai block detected, retrying with retry context...")
+        page2 = None
+        blocked = False
         try:
-            context2 = browser.new_context(
-                viewport={"width": 1280, "height": 900},
-                locale="en-US",
-            )
-            stealth.apply_stealth_sync(context2)
-            page2 = context2.new_page()
-
+            page2 = _get_retry_page(browser)
             api_responses2 = []
+            capture2 = threading.Event()
+            capture2.set()
 
             def on_response2(response):
-                if "hs-consumer-api" in response.url and "/comments" in response.url:
+                if capture2.is_set() and _is_comments_response(response):
                     try:
-                        body = response.json()
-                        api_responses2.append(body)
+                        api_responses2.append(_comments_page(response))
                     except Exception as exc:
-                        print(
-                            f"  Warning: Failed to parse API response: {exc}",
-                            file=sys.stderr,
-                        )
+                        _log.warning(f"  Warning: Failed to parse API response: {exc}")
+
+            crashed2 = threading.Event()
+
+            def on_crash2(_page):
+                crashed2.set()
 
             page2.on("response", on_response2)
+            page2.on("crash", on_crash2)
 
             time.sleep(3)  # Wait before retry
+            _bucket.acquire()
             page2.goto(
                 match_url + "/ball-by-ball-commentary",
                 wait_until="domcontentloaded",
                 timeout=30000,
             )
-            time.sleep(1.5)
+            _wait_for_next_data(page2)
 
             title2 = page2.title()
             if "access denied" in title2.lower():
+                blocked = True
                 raise Exception("Blocked by Akamai (retry also failed)")
 
             # Continue scraping with the new page/context
-            result = _scrape_innings_loop(page2, api_responses2, max_innings)
+            result = _scrape_innings_loop(page2, api_responses2, max_innings, crashed2,
+                                          capture=capture2)
             return result
         except Exception as retry_err:
+            blocked = True
             raise Exception(f"Blocked by Akamai: {retry_err}")
         finally:
-            if context2:
+            if page2 is not None:
                 try:
-                    context2.close()
+                    page2.remove_listener("response", on_response2)
+                    page2.remove_listener("crash", on_crash2)
                 except Exception:
                     pass
+            if blocked:
+                # A blocked (or broken) retry context is no use to the next match
+                _close_retry_context(browser)
+            elif page2 is not None:
+                _release_page(page2)
 
-    result = _scrape_innings_loop(page, api_responses, max_innings)
-    page.remove_listener("response", on_response)
-    return result
-
+    try:
+        return _scrape_innings_loop(page, api_responses, max_innings, crashed,
+                                    capture=capture)
+    finally:
+        detach()
+
+
+def _scrape_innings_loop(page, api_responses, max_innings, crashed=None,
+                         next_data=None, fast_only=False, capture=None):
+    """Core innings scraping loop, shared by initial attempt and retry.
+
+    ``crashed`` is a threading.Event set by the page's crash listener.
+    ``capture`` is the Event gating the page's response listener; it is
+    cleared around in-page API fetches and set for switch/scroll capture.
+    ``next_data`` skips reading __NEXT_DATA__ from the page. With
+    ``fast_only``, returns None instead of falling back to the dropdown
+    when the SSR data or the parallel commentary API path falls short.
+    """
 
-def _scrape_innings_loop(page, api_responses, max_innings):
-    """Core innings scraping loop, shared by initial attempt and retry."""
+    # Read __NEXT_DATA__ once; all SSR extraction below works on this dict.
+    # A missing payload becomes an empty dict so the extractors below fail
+    # fast instead of each re-reading the page.
+    if next_data is None:
+        try:
+            next_data = _read_next_data(page) or _EMPTY
+        except Exception as e:
+            _log.warning(f"    Warning: could not read __NEXT_DATA__: {e}")
+            next_data = _EMPTY
 
     # Early check: does this match have rich ball-by-ball data?
     # Also extract match format for auto-classification
-    initial_check = page.evaluate(
-        """
-        () => {
-            try {
-                const nd = JSON.parse(document.getElementById('__NEXT_DATA__').textContent);
-                const data = nd.props.appPageProps.data;
-                const content = data.content;
-                const match = data.match || {};
-                const comments = content.comments || [];
-                const hasRich = comments.some(c => c.wagonX != null || c.predictions != null);
-                const hasBalls = comments.some(c => c.overNumber != null);
-                return {
-                    hasRich, hasBalls, commentCount: comments.length,
-                    matchFormat: match.format,
-                    internationalClassId: match.internationalClassId,
-                    gender: match.gender,
-                    slug: match.slug || '',
-                    teams: (match.teams || []).map(t => t.team?.abbreviation || ''),
-                };
-            } catch(e) {
-                return { error: e.message };
-            }
-        }
-    """
-    )
+    initial_check = _initial_check(next_data)
+    if fast_only and "error" in initial_check:
+        return None
 
     has_hawkeye = initial_check.get("hasRich", False)
     has_balls = initial_check.get("hasBalls", False)
@@ -609,20 +1181,60 @@ def _scrape_innings_loop(page, api_responses, max_innings):
     detected_gender = _detect_gender(initial_check)
 
     # Extract match metadata and innings data (zero extra network calls)
-    match_meta = extract_match_metadata(page)
-    innings_data = extract_innings_data(page)
+    match_meta = extract_match_metadata(page, next_data)
+    innings_data = extract_innings_data(page, next_data)
 
     if not has_balls:
-        scorecard = _extract_scorecard(page)
+        scorecard = _extract_scorecard(page, next_data)
         return {"balls": [], "has_hawkeye": False, "scorecard": scorecard,
                 "match_meta": match_meta, "innings_data": innings_data,
                 "detected_format": detected_format, "detected_gender": detected_gender}
 
     if not has_hawkeye:
-        print(f"      (no rich data - scraping basic ball-by-ball)")
+        _log.info(f"      (no rich data - scraping basic ball-by-ball)")
+
+    comments_api = None
+    if initial_check.get("matchId") and initial_check.get("seriesId"):
+        comments_api = COMMENTS_API_URL.format(
+            series_id=initial_check["seriesId"], match_id=initial_check["matchId"]
+        )
+
+    result = {"has_hawkeye": has_hawkeye, "scorecard": None,
+              "match_meta": match_meta, "innings_data": innings_data,
+              "detected_format": detected_format, "detected_gender": detected_gender}
+
+    ssr_data = _read_ssr_comments(next_data)
+
+    # Fast path: fetch every innings from the commentary API in parallel,
+    # no dropdown switching needed
+    inning_numbers = initial_check.get("inningNumbers") or _EMPTY_LIST
+    if comments_api and inning_numbers and ssr_data.get("comments"):
+        # In-page fetches: keep the response listener from parsing them too
+        if capture is not None:
+            capture.clear()
+        try:
+            api_result = _scrape_innings_parallel(page, comments_api, inning_numbers, ssr_data)
+        finally:
+            if capture is not None:
+                capture.set()
+        if api_result is not None:
+            all_balls, innings_failures = api_result
+            innings_scraped = len(set(b.get("inningNumber") for b in all_balls)) if all_balls else 0
+            result.update({"balls": all_balls, "innings_expected": len(inning_numbers),
+                           "innings_scraped": innings_scraped,
+                           "innings_failures": innings_failures})
+            return result
+    if fast_only:
+        return None
+
+    # The dropdown needs the hydrated page, not just the SSR HTML
+    try:
+        page.wait_for_load_state("load", timeout=15000)
+    except PlaywrightTimeoutError:
+        pass
 
-    # Discover available innings from the dropdown
-    available_innings = _discover_innings(page)
+    # Innings list from __NEXT_DATA__ when unambiguous, else from the dropdown
+    available_innings = initial_check.get("innings") or _discover_innings(page)
     if not available_innings:
         available_innings = [
             {"title": f"Innings {i+1}", "index": i} for i in range(max_innings)
@@ -632,13 +1244,21 @@ def _scrape_innings_loop(page, api_responses, max_innings):
     innings_failures = []
 
     for innings_idx, innings_item in enumerate(available_innings):
+        next_over = None
         if innings_idx > 0:
             api_responses.clear()
             try:
-                _switch_to_innings(page, innings_item["title"])
-                time.sleep(2)
+                _bucket.acquire()
+                # Wait for the commentary page the switch loads, not a fixed sleep
+                with page.expect_response(_is_comments_response,
+                                          timeout=INNINGS_SWITCH_TIMEOUT_MS) as switch_resp:
+                    _switch_to_innings(page, innings_item["title"])
+                if not api_responses:
+                    api_responses.append(_comments_page(switch_resp.value))
+            except PlaywrightTimeoutError:
+                pass  # Switched but nothing loaded yet; scroll pagination picks it up
             except Exception as e:
-                print(f"      Innings switch to '{innings_item['title']}' failed: {e}")
+                _log.warning(f"      Innings switch to '{innings_item['title']}' failed: {e}")
                 innings_failures.append({
                     "innings": innings_idx + 1,
                     "title": innings_item["title"],
@@ -647,33 +1267,20 @@ def _scrape_innings_loop(page, api_responses, max_innings):
                 })
                 continue
 
-        # Get initial data for current innings
+        # Get initial data for current innings: SSR for the first, the page
+        # the switch itself loaded for later ones
         ssr_balls = []
         inn_num = innings_idx + 1
+        if innings_idx > 0 and api_responses:
+            ssr_balls = [c for resp in api_responses for c in resp["comments"]]
+            next_over = api_responses[-1].get("nextInningOver")
+            if ssr_balls:
+                inn_num = ssr_balls[0].get("inningNumber", inn_num)
 
         if innings_idx == 0:
-            ssr_data = page.evaluate(
-                """
-                () => {
-                    try {
-                        const nd = JSON.parse(document.getElementById('__NEXT_DATA__').textContent);
-                        const content = nd.props.appPageProps.data.content;
-                        return {
-                            comments: content.comments || [],
-                            nextInningOver: content.nextInningOver,
-                            currentInningNumber: content.currentInningNumber,
-                        };
-                    } catch(e) {
-                        return { error: e.message };
-                    }
-                }
-            """
-            )
             if ssr_data.get("error") or not ssr_data.get("comments"):
                 err_detail = ssr_data.get('error', 'empty')
-                print(
-                    f"      Innings {innings_idx+1}: No SSR data ({err_detail})"
-                )
+                _log.warning(f"      Innings {innings_idx+1}: No SSR data ({err_detail})")
                 innings_failures.append({
                     "innings": innings_idx + 1,
                     "title": innings_item["title"],
@@ -685,101 +1292,380 @@ def _scrape_innings_loop(page, api_responses, max_innings):
                 c for c in ssr_data["comments"] if c.get("overNumber") is not None
             ]
             inn_num = ssr_data.get("currentInningNumber", innings_idx + 1)
+            next_over = ssr_data.get("nextInningOver")
+
+        # Page through older overs with direct API fetches; fall back to
+        # scroll-triggered pagination if the API can't be called directly
+        comment_pages = None
+        api_error = None
+        if comments_api and ssr_balls:
+            if capture is not None:
+                capture.clear()
+            try:
+                fetched = _fetch_comment_pages(
+                    page, comments_api, [{"inning": inn_num, "over": next_over}]
+                )
+            finally:
+                if capture is not None:
+                    capture.set()
+            if fetched is not None:
+                comment_pages, api_error = fetched[0]
+        if comment_pages is None:
+            api_responses.clear()
+            comment_pages = _scroll_comment_pages(page, api_responses, crashed)
+        elif api_error:
+            # API stopped part-way: the page's own scroll pagination covers
+            # the rest (balls merge by id, so re-fetched overs are harmless)
+            api_responses.clear()
+            scrolled = _scroll_comment_pages(page, api_responses, crashed)
+            if not scrolled or scrolled[-1].get("nextInningOver") is not None:
+                innings_failures.append({
+                    "innings": innings_idx + 1,
+                    "title": innings_item["title"],
+                    "error_type": "api_partial",
+                    "error_message": f"Commentary API stopped after {len(comment_pages)} "
+                                     f"pages ({api_error}); scroll fallback incomplete",
+                })
+            comment_pages = comment_pages + scrolled
 
-        # Clear api_responses before scrolling
-        api_responses.clear()
+        innings_balls = _merge_innings_balls(ssr_balls, comment_pages)
 
-        # Dismiss overlays and trigger pagination via scrolling
-        _dismiss_overlays(page)
+        if innings_balls and innings_idx > 0:
+            inn_num = innings_balls[0].get("inningNumber", innings_idx + 1)
 
-        # Scroll pagination: keyboard End/Home triggers IntersectionObserver
-        prev_count = 0
-        stale_rounds = 0
-        max_scrolls = 200
+        if not innings_balls:
+            if innings_idx > 0:
+                _log.warning(f"      Innings switch: no ball data captured")
+                innings_failures.append({
+                    "innings": innings_idx + 1,
+                    "title": innings_item["title"],
+                    "error_type": "no_ball_data",
+                    "error_message": "Innings switch succeeded but no balls captured",
+                })
+            continue
 
-        for i in range(max_scrolls):
-            try:
-                if i % 2 == 0:
-                    page.keyboard.press("End")
-                else:
-                    page.keyboard.press("Home")
-                    time.sleep(0.1)
-                    page.keyboard.press("End")
-            except Exception:
-                # Page likely crashed — attempt recovery
-                if _recover_page(page):
-                    stale_rounds += 1  # Count as stale, pagination state is lost
-                    continue
-                else:
-                    print("      Page unrecoverable, aborting innings")
-                    break
+        _print_innings_summary(inn_num, innings_balls, len(comment_pages))
+        all_balls.extend(innings_balls)
+
+    innings_scraped = len(set(b.get("inningNumber") for b in all_balls)) if all_balls else 0
+    result.update({"balls": all_balls, "innings_expected": len(available_innings),
+                   "innings_scraped": innings_scraped, "innings_failures": innings_failures})
+    return result
+
+
+# Same-origin, script-free page that --fetch-html keeps the tab on between
+# matches, so in-page fetches carry the site's cookies without a render
+_LIGHT_PAGE_URL = "https://www.espncricinfo.com/robots.txt"
+
+
+def _scrape_match_fetched(page, full_url, max_innings):
+    """Scrape a match from its fetched SSR HTML, without rendering the page.
+
+    Returns the scrape_match_commentary result, or None when the fetch is
+    blocked/empty or the match needs the rendered page (dropdown fallback).
+    """
+    try:
+        if page.url != _LIGHT_PAGE_URL:
+            page.goto(_LIGHT_PAGE_URL, wait_until="domcontentloaded", timeout=15000)
+        _bucket.acquire()
+        nd_text = page.evaluate("(url) => window.__cricinfo.fetchNextData(url)", full_url)
+        if not nd_text:
+            return None
+        return _scrape_innings_loop(page, [], max_innings,
+                                    next_data=_json_loads(nd_text), fast_only=True)
+    except Exception as e:
+        _log.warning(f"      HTML fetch failed: {e}")
+        return None
+
+
+def _initial_check(next_data):
+    """Summarise the SSR payload: ball/rich-data presence plus format/gender hints."""
+    try:
+        data = _page_data(next_data)
+        content = data["content"]
+        match = data.get("match") or _EMPTY
+        comments = content.get("comments") or _EMPTY_LIST
+        return {
+            "hasRich": any(
+                c.get("wagonX") is not None or c.get("predictions") is not None
+                for c in comments
+            ),
+            "hasBalls": any(c.get("overNumber") is not None for c in comments),
+            "commentCount": len(comments),
+            "matchFormat": match.get("format"),
+            "internationalClassId": match.get("internationalClassId"),
+            "gender": match.get("gender"),
+            "slug": match.get("slug") or "",
+            "teams": [(t.get("team") or _EMPTY).get("abbreviation") or ""
+                      for t in match.get("teams") or _EMPTY_LIST],
+            "matchId": match.get("objectId"),
+            "seriesId": (match.get("series") or _EMPTY).get("objectId"),
+            "inningNumbers": [i["inningNumber"] for i in content.get("innings") or _EMPTY_LIST
+                              if i.get("inningNumber") is not None],
+            "innings": _innings_from_ssr(content),
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _innings_from_ssr(content):
+    """Dropdown-style innings list from the SSR payload, current innings first.
+
+    Titles are team names, which the dropdown match resolves (exact
+    normalized title first, a substring match only when it is unique).
+    Returns [] when a team bats twice (Tests) — its two entries would be
+    ambiguous, so the caller falls back to reading the dropdown.
+    """
+    result = []
+    titles = set()
+    for inn in content.get("innings") or _EMPTY_LIST:
+        team = inn.get("team") or _EMPTY
+        title = team.get("longName") or team.get("name") or ""
+        if not title or title in titles:
+            return []
+        titles.add(title)
+        result.append({"title": title, "inningNumber": inn.get("inningNumber")})
+    current = content.get("currentInningNumber")
+    result.sort(key=lambda item: item["inningNumber"] != current)
+    return result
+
+
+def _read_ssr_comments(next_data):
+    """The server-rendered commentary page (current innings) from __NEXT_DATA__."""
+    try:
+        content = _page_data(next_data)["content"]
+        return {
+            "comments": content.get("comments") or _EMPTY_LIST,
+            "nextInningOver": content.get("nextInningOver"),
+            "currentInningNumber": content.get("currentInningNumber"),
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _ball_sort_key(ball):
+    """Over/ball order as one packed int (ballNumber < 1024), compared in C."""
+    return ((ball.get("overNumber") or 0) << 10) | (ball.get("ballNumber") or 0)
+
+
+def _merge_innings_balls(seed_balls, comment_pages):
+    """Combine seed + paginated balls for one innings, deduplicated by id, in over order.
+
+    Keyed by ball id rather than (over, ball): wides/no-balls share the
+    delivery number of the ball that is re-bowled. First occurrence wins, so
+    SSR/seed balls take priority over API pages.
+    """
+    by_id = {}
+    for ball in seed_balls:
+        bid = ball.get("id")
+        if bid:
+            by_id.setdefault(bid, ball)
+    for resp in comment_pages:
+        for ball in resp.get("comments", _EMPTY_LIST):
+            if ball.get("overNumber") is not None:
+                bid = ball.get("id")
+                if bid:
+                    by_id.setdefault(bid, ball)
+    return sorted(by_id.values(), key=_ball_sort_key)
+
+
+def _print_innings_summary(inn_num, innings_balls, n_pages):
+    """Print the per-innings ball/over/rich-data summary line."""
+    rich_count = sum(1 for b in innings_balls if b.get("wagonX") is not None)
+    overs = sorted(set(b.get("overNumber") for b in innings_balls))
+    over_range = f"{min(overs)}-{max(overs)}" if overs else "none"
+    _log.info(
+        f"      Innings {inn_num}: {len(innings_balls)} balls, overs {over_range}, rich={rich_count}/{len(innings_balls)}, pages={n_pages}"
+    )
+
+
+def _scrape_innings_parallel(page, api_url, inning_numbers, ssr_data):
+    """Fetch all innings concurrently from the commentary API.
+
+    The SSR innings continues from its nextInningOver; every other innings is
+    fetched from its latest over down. Returns (balls, innings_failures), or
+    None if the API could not be used or stopped short for any innings
+    (caller falls back to the dropdown loop).
+    """
+    ssr_inning = ssr_data.get("currentInningNumber")
+    ssr_balls = [c for c in ssr_data["comments"] if c.get("overNumber") is not None]
+
+    jobs = []
+    for inning in inning_numbers:
+        if inning == ssr_inning:
+            if ssr_data.get("nextInningOver") is not None:
+                jobs.append({"inning": inning, "over": ssr_data["nextInningOver"]})
+        else:
+            jobs.append({"inning": inning, "over": None, "fromTop": True})
+
+    fetched = _fetch_comment_pages(page, api_url, jobs) if jobs else []
+    if fetched is None:
+        return None
+    # Any innings cut short (403/429, block page, page cap): let the dropdown
+    # loop redo the match rather than save a silently short innings
+    if any(error for _, error in fetched):
+        _log.info("      (commentary API incomplete - falling back to the dropdown)")
+        return None
+    pages_by_inning = {job["inning"]: pages for job, (pages, _) in zip(jobs, fetched)}
+
+    all_balls = []
+    innings_failures = []
+    for idx, inning in enumerate(inning_numbers):
+        comment_pages = pages_by_inning.get(inning, _EMPTY_LIST)
+        seed = ssr_balls if inning == ssr_inning else []
+        innings_balls = _merge_innings_balls(seed, comment_pages)
+        if not innings_balls:
+            _log.warning(f"      Innings {inning}: no ball data from commentary API")
+            innings_failures.append({
+                "innings": idx + 1,
+                "title": f"Innings {inning}",
+                "error_type": "no_ball_data",
+                "error_message": "Commentary API returned no balls",
+            })
+            continue
+        _print_innings_summary(inning, innings_balls, len(comment_pages))
+        all_balls.extend(innings_balls)
+    return all_balls, innings_failures
+
+
+# Commentary API the match page itself paginates against; called from inside
+# the page so requests carry the page's cookies and origin.
+COMMENTS_API_URL = (
+    "https://hs-consumer-api.espncricinfo.com/v1/pages/match/comments"
+    "?lang=en&seriesId={series_id}&matchId={match_id}"
+    "&commentType=ALL&sortDirection=DESC"
+)
+MAX_COMMENT_PAGES = 200
+# Innings fetched concurrently from one page (a Test has at most 4)
+MAX_PARALLEL_INNINGS = 4
+
+
+def _fetch_comment_pages(page, api_url, jobs):
+    """Fetch commentary pages for one or more innings via in-page fetch().
+
+    Each job is {"inning": n, "over": start} and follows nextInningOver from
+    start until that innings is exhausted; with "fromTop" set, the latest
+    page of the innings is fetched first. Pages are fetched in rounds of one
+    page per job (up to MAX_PARALLEL_INNINGS jobs at once), each page taking
+    its own _bucket token, so --rate holds for API traffic too. Returns one
+    (pages, error) pair per job — error is None when the innings was paged to
+    its start, else why it stopped, with the pages fetched before that — or
+    None if the API could not be used (caller falls back to scroll pagination).
+    """
+    state = [{"inning": job["inning"], "over": job.get("over"),
+              "first": bool(job.get("fromTop")), "pages": [], "error": None}
+             for job in jobs]
+
+    while True:
+        active = [st for st in state
+                  if st["error"] is None and (st["first"] or st["over"] is not None)
+                  and len(st["pages"]) < MAX_COMMENT_PAGES][:MAX_PARALLEL_INNINGS]
+        if not active:
+            break
+        steps = [{"inning": st["inning"], "over": None if st["first"] else st["over"]}
+                 for st in active]
+        for _ in steps:
+            _bucket.acquire()
+        try:
+            results = page.evaluate(
+                "(args) => window.__cricinfo.fetchCommentsRound(args)", [api_url, steps]
+            )
+        except Exception as e:
+            if not any(st["pages"] for st in state):
+                _log.warning(f"      Comments API fetch failed, falling back: {e}")
+                return None
+            for st in active:
+                st["error"] = str(e)
+            break
+        for st, res in zip(active, results):
+            if res.get("error"):
+                st["error"] = res["error"]
+                continue
+            st["pages"].append(res["page"])
+            st["over"] = res["page"].get("nextInningOver")
+            st["first"] = False
+
+    for st in state:
+        if st["error"] is None and st["over"] is not None and not st["first"]:
+            st["error"] = f"page limit ({MAX_COMMENT_PAGES}) reached"
 
-            time.sleep(0.7)
+    # Nothing came back at all: treat the API as unusable for this page
+    if state and all(st["error"] and not st["pages"] for st in state):
+        _log.warning(f"      Comments API fetch failed ({state[0]['error']}), falling back")
+        return None
 
-            if i % 15 == 14:
-                _dismiss_overlays(page)
+    for st in state:
+        if st["error"]:
+            _log.warning(f"      Innings {st['inning']}: comments API stopped after "
+                         f"{len(st['pages'])} pages ({st['error']})")
+    return [(st["pages"], st["error"]) for st in state]
 
-            curr_count = len(api_responses)
-            if curr_count > prev_count:
-                prev_count = curr_count
-                stale_rounds = 0
-                last = api_responses[-1]
-                if last.get("nextInningOver") is None:
-                    break
-            else:
-                stale_rounds += 1
-                if stale_rounds >= 5:
-                    break
-
-        # Combine SSR + API balls, deduplicate by id
-        seen_ids = set()
-        innings_balls = []
-        for ball in ssr_balls:
-            bid = ball.get("id")
-            if bid and bid not in seen_ids:
-                seen_ids.add(bid)
-                innings_balls.append(ball)
-        for resp in api_responses:
-            for ball in resp.get("comments", []):
-                if ball.get("overNumber") is not None:
-                    bid = ball.get("id")
-                    if bid and bid not in seen_ids:
-                        seen_ids.add(bid)
-                        innings_balls.append(ball)
-
-        innings_balls.sort(
-            key=lambda b: (b.get("overNumber", 0), b.get("ballNumber", 0))
-        )
 
-        if innings_balls and innings_idx > 0:
-            inn_num = innings_balls[0].get("inningNumber", innings_idx + 1)
+SCROLL_WAIT_MIN_S = 0.2
+SCROLL_WAIT_MAX_S = 1.0
+# Stop once this long has been spent waiting with no new page (the old fixed
+# 5 x 0.7s polls); time-based so the faster early polls don't shorten it
+SCROLL_STALE_S = 3.5
 
-        rich_count = sum(1 for b in innings_balls if b.get("wagonX") is not None)
-        overs = sorted(set(b.get("overNumber") for b in innings_balls))
-        if not innings_balls:
-            if innings_idx > 0:
-                print(f"      Innings switch: no ball data captured")
-                innings_failures.append({
-                    "innings": innings_idx + 1,
-                    "title": innings_item["title"],
-                    "error_type": "no_ball_data",
-                    "error_message": "Innings switch succeeded but no balls captured",
-                })
-            continue
 
-        over_range = f"{min(overs)}-{max(overs)}" if overs else "none"
-        print(
-            f"      Innings {inn_num}: {len(innings_balls)} balls, overs {over_range}, rich={rich_count}/{len(innings_balls)}, pages={len(api_responses)}"
-        )
+def _scroll_comment_pages(page, api_responses, crashed=None):
+    """Paginate by scrolling: jumping to the bottom triggers the IntersectionObserver.
 
-        all_balls.extend(innings_balls)
+    Pages arrive through the on_response listener (its capture Event is set
+    here) into api_responses, which is returned once the innings is exhausted,
+    pagination stalls or the page crashes.
+    """
+    if crashed is not None and crashed.is_set():
+        _log.warning("      Page crashed, skipping pagination")
+        return list(api_responses)
+
+    # Already at the innings' first over (e.g. the switch loaded the last page)
+    if api_responses and api_responses[-1].get("nextInningOver") is None:
+        return list(api_responses)
+
+    # Fallback sweep; the init-script observer strips overlays as they appear
+    _dismiss_overlays(page)
+
+    prev_count = len(api_responses)
+    stale_s = 0.0
+    max_scrolls = 200
+    # Poll quickly after a page lands, backing off while nothing arrives
+    wait = SCROLL_WAIT_MIN_S
+
+    for i in range(max_scrolls):
+        if crashed is not None and crashed.is_set():
+            _log.warning("      Page crashed, aborting innings")
+            break
+        try:
+            # One evaluate per tick instead of one or two key events
+            _raw_eval(page, f"window.__cricinfo.scrollToEnd({'true' if i % 2 else 'false'})",
+                      await_promise=True)
+        except Exception:
+            # Page likely crashed — attempt recovery
+            if _recover_page(page):
+                stale_s += SCROLL_WAIT_MAX_S  # Count as stale, pagination state is lost
+                continue
+            else:
+                _log.warning("      Page unrecoverable, aborting innings")
+                break
+
+        time.sleep(wait)
+
+        curr_count = len(api_responses)
+        if curr_count > prev_count:
+            prev_count = curr_count
+            stale_s = 0.0
+            wait = SCROLL_WAIT_MIN_S
+            last = api_responses[-1]
+            if last.get("nextInningOver") is None:
+                break
+        else:
+            stale_s += wait
+            if stale_s >= SCROLL_STALE_S:
+                break
+            wait = min(wait * 1.4, SCROLL_WAIT_MAX_S)
 
-    innings_scraped = len(set(b.get("inningNumber") for b in all_balls)) if all_balls else 0
-    return {"balls": all_balls, "has_hawkeye": has_hawkeye, "scorecard": None,
-            "match_meta": match_meta, "innings_data": innings_data,
-            "detected_format": detected_format, "detected_gender": detected_gender,
-            "innings_expected": len(available_innings), "innings_scraped": innings_scraped,
-            "innings_failures": innings_failures}
+    return list(api_responses)
 
 
 FORMAT_MAP = {
@@ -807,8 +1693,8 @@ def _detect_format(initial_check):
         return FORMAT_MAP[class_id]
     # Fall back to match.format string
     fmt_str = initial_check.get("matchFormat")
-    if fmt_str and fmt_str.upper() in FORMAT_MAP:
-        return FORMAT_MAP[fmt_str.upper()]
+    if fmt_str:
+        return FORMAT_MAP.get(fmt_str.upper())
     return None
 
 
@@ -818,9 +1704,10 @@ def _detect_gender(initial_check):
     # Direct gender field (most reliable)
     gender = initial_check.get("gender")
     if gender:
-        return gender.lower() if gender.lower() in ("male", "female") else None
+        gender = gender.lower()
+        return gender if gender in ("male", "female") else None
     # Heuristic: check team abbreviations for -W suffix (e.g. IND-W, AUS-W)
-    teams = initial_check.get("teams", [])
+    teams = initial_check.get("teams", _EMPTY_LIST)
     if teams and all(t.endswith("-W") for t in teams if t):
         return "female"
     # Heuristic: check slug for "women" keyword
@@ -832,286 +1719,205 @@ def _detect_gender(initial_check):
     return None
 
 
-def extract_match_metadata(page):
+def extract_match_metadata(page, next_data=None):
     """Extract match-level metadata from __NEXT_DATA__.
 
     Returns a flat dict suitable for a single-row parquet table, or None on failure.
-    Fields come from data.match + data.content.supportInfo.
+    Fields come from data.match + data.content.supportInfo. Pass next_data to
+    reuse an already-parsed __NEXT_DATA__.
     """
-    raw = page.evaluate(
-        """
-        () => {
-            try {
-                const nd = JSON.parse(document.getElementById('__NEXT_DATA__').textContent);
-                const data = nd.props.appPageProps.data;
-                const match = data.match || {};
-                const support = (data.content || {}).supportInfo || {};
-                const teams = match.teams || [];
-                const umpires = match.umpires || [];
-                const tvUmpires = match.tvUmpires || [];
-                const matchReferees = match.matchReferees || [];
-                const potm = (support.playersOfTheMatch || [])[0] || {};
-                const ground = match.ground || {};
-                const t0 = teams[0] || {};
-                const t1 = teams[1] || {};
-
-                return {
-                    match_id: match.objectId,
-                    title: match.title,
-                    series_id: (match.series || {}).objectId,
-                    series_name: (match.series || {}).longName,
-                    format: match.format,
-                    international_class_id: match.internationalClassId,
-                    gender: match.gender,
-                    start_date: match.startDate,
-                    end_date: match.endDate,
-                    start_time: match.startTime,
-                    status: match.status,
-                    status_text: match.statusText,
-                    slug: match.slug,
-                    ground_id: ground.objectId,
-                    ground_name: ground.name,
-                    ground_long_name: ground.longName,
-                    country_name: (ground.country || {}).name,
-                    city_name: (ground.town || {}).name,
-                    toss_winner_team_id: match.tossWinnerTeamId,
-                    toss_winner_choice: match.tossWinnerChoice,
-                    winner_team_id: match.winnerTeamId,
-                    scheduled_overs: match.scheduledOvers,
-                    hawkeye_source: match.hawkeyeSource,
-                    ball_by_ball_source: match.ballByBallSource,
-                    team1_id: (t0.team || {}).objectId,
-                    team1_name: (t0.team || {}).longName,
-                    team1_abbreviation: (t0.team || {}).abbreviation,
-                    team1_captain_id: (t0.captain || {}).objectId,
-                    team1_is_home: t0.isHome,
-                    team2_id: (t1.team || {}).objectId,
-                    team2_name: (t1.team || {}).longName,
-                    team2_abbreviation: (t1.team || {}).abbreviation,
-                    team2_captain_id: (t1.captain || {}).objectId,
-                    team2_is_home: t1.isHome,
-                    umpire1_id: (umpires[0] || {}).objectId,
-                    umpire1_name: (umpires[0] || {}).longName,
-                    umpire2_id: (umpires[1] || {}).objectId,
-                    umpire2_name: (umpires[1] || {}).longName,
-                    tv_umpire_id: (tvUmpires[0] || {}).objectId,
-                    tv_umpire_name: (tvUmpires[0] || {}).longName,
-                    match_referee_id: (matchReferees[0] || {}).objectId,
-                    match_referee_name: (matchReferees[0] || {}).longName,
-                    potm_player_id: (potm.player || {}).objectId,
-                    potm_player_name: (potm.player || {}).longName,
-                };
-            } catch(e) {
-                return { __error: e.message };
-            }
+    try:
+        if next_data is None:
+            next_data = _read_next_data(page)
+        data = _page_data(next_data)
+        match = data.get("match") or _EMPTY
+        support = (data.get("content") or _EMPTY).get("supportInfo") or _EMPTY
+        teams = match.get("teams") or _EMPTY_LIST
+        umpires = match.get("umpires") or _EMPTY_LIST
+        tv_umpire = _first(match.get("tvUmpires")) or _EMPTY
+        referee = _first(match.get("matchReferees")) or _EMPTY
+        potm = (_first(support.get("playersOfTheMatch")) or _EMPTY).get("player") or _EMPTY
+        ground = match.get("ground") or _EMPTY
+        series = match.get("series") or _EMPTY
+        t0 = teams[0] if len(teams) > 0 else _EMPTY
+        t1 = teams[1] if len(teams) > 1 else _EMPTY
+        team0 = t0.get("team") or _EMPTY
+        team1 = t1.get("team") or _EMPTY
+        ump0 = umpires[0] if len(umpires) > 0 else _EMPTY
+        ump1 = umpires[1] if len(umpires) > 1 else _EMPTY
+
+        return {
+            "match_id": match.get("objectId"),
+            "title": match.get("title"),
+            "series_id": series.get("objectId"),
+            "series_name": series.get("longName"),
+            "format": match.get("format"),
+            "international_class_id": match.get("internationalClassId"),
+            "gender": match.get("gender"),
+            "start_date": match.get("startDate"),
+            "end_date": match.get("endDate"),
+            "start_time": match.get("startTime"),
+            "status": match.get("status"),
+            "status_text": match.get("statusText"),
+            "slug": match.get("slug"),
+            "ground_id": ground.get("objectId"),
+            "ground_name": ground.get("name"),
+            "ground_long_name": ground.get("longName"),
+            "country_name": (ground.get("country") or _EMPTY).get("name"),
+            "city_name": (ground.get("town") or _EMPTY).get("name"),
+            "toss_winner_team_id": match.get("tossWinnerTeamId"),
+            "toss_winner_choice": match.get("tossWinnerChoice"),
+            "winner_team_id": match.get("winnerTeamId"),
+            "scheduled_overs": match.get("scheduledOvers"),
+            "hawkeye_source": match.get("hawkeyeSource"),
+            "ball_by_ball_source": match.get("ballByBallSource"),
+            "team1_id": team0.get("objectId"),
+            "team1_name": team0.get("longName"),
+            "team1_abbreviation": team0.get("abbreviation"),
+            "team1_captain_id": (t0.get("captain") or _EMPTY).get("objectId"),
+            "team1_is_home": t0.get("isHome"),
+            "team2_id": team1.get("objectId"),
+            "team2_name": team1.get("longName"),
+            "team2_abbreviation": team1.get("abbreviation"),
+            "team2_captain_id": (t1.get("captain") or _EMPTY).get("objectId"),
+            "team2_is_home": t1.get("isHome"),
+            "umpire1_id": ump0.get("objectId"),
+            "umpire1_name": ump0.get("longName"),
+            "umpire2_id": ump1.get("objectId"),
+            "umpire2_name": ump1.get("longName"),
+            "tv_umpire_id": tv_umpire.get("objectId"),
+            "tv_umpire_name": tv_umpire.get("longName"),
+            "match_referee_id": referee.get("objectId"),
+            "match_referee_name": referee.get("longName"),
+            "potm_player_id": potm.get("objectId"),
+            "potm_player_name": potm.get("longName"),
         }
-    """
-    )
-    if isinstance(raw, dict) and raw.get("__error"):
-        print(f"    Warning: match metadata extraction failed: {raw['__error']}", file=sys.stderr)
+    except Exception as e:
+        _log.warning(f"    Warning: match metadata extraction failed: {e}")
         return None
-    return raw
 
 
-def extract_innings_data(page):
+def extract_innings_data(page, next_data=None):
     """Extract innings summaries with batting scorecards and player details.
 
     Returns a list of dicts (one row per batsman per innings), or empty list on failure.
     Fields come from data.content.innings[].inningBatsmen[].
     """
-    raw = page.evaluate(
-        """
-        () => {
-            try {
-                const nd = JSON.parse(document.getElementById('__NEXT_DATA__').textContent);
-                const data = nd.props.appPageProps.data;
-                const innings = (data.content || {}).innings || [];
-                const rows = [];
-
-                for (const inn of innings) {
-                    const team = inn.team || {};
-                    const batsmen = inn.inningBatsmen || [];
-
-                    for (const bat of batsmen) {
-                        const player = bat.player || {};
-                        rows.push({
-                            innings_number: inn.inningNumber,
-                            team_id: team.objectId,
-                            team_name: team.longName,
-                            total_runs: inn.runs,
-                            total_wickets: inn.wickets,
-                            total_overs: inn.overs,
-                            player_id: player.objectId,
-                            player_name: player.longName,
-                            player_dob: player.dateOfBirth,
-                            batting_style: (player.battingStyles || [])[0] || null,
-                            bowling_style: (player.bowlingStyles || [])[0] || null,
-                            playing_role: player.playingRole,
-                            runs: bat.runs,
-                            balls_faced: bat.ballsFaced,
-                            fours: bat.fours,
-                            sixes: bat.sixes,
-                            strike_rate: bat.strikerate || bat.strikeRate,
-                            is_not_out: bat.isNotOut,
-                            batting_position: bat.battingPosition,
-                        });
-                    }
-                }
-                return rows;
-            } catch(e) {
-                return { __error: e.message };
-            }
-        }
-    """
-    )
-    if isinstance(raw, dict) and raw.get("__error"):
-        print(f"    Warning: innings data extraction failed: {raw['__error']}", file=sys.stderr)
+    try:
+        if next_data is None:
+            next_data = _read_next_data(page)
+        data = _page_data(next_data)
+        rows = []
+        for inn in (data.get("content") or _EMPTY).get("innings") or _EMPTY_LIST:
+            team = inn.get("team") or _EMPTY
+            for bat in inn.get("inningBatsmen") or _EMPTY_LIST:
+                player = bat.get("player") or _EMPTY
+                rows.append({
+                    "innings_number": inn.get("inningNumber"),
+                    "team_id": team.get("objectId"),
+                    "team_name": team.get("longName"),
+                    "total_runs": inn.get("runs"),
+                    "total_wickets": inn.get("wickets"),
+                    "total_overs": inn.get("overs"),
+                    "player_id": player.get("objectId"),
+                    "player_name": player.get("longName"),
+                    "player_dob": player.get("dateOfBirth"),
+                    "batting_style": _first(player.get("battingStyles")) or None,
+                    "bowling_style": _first(player.get("bowlingStyles")) or None,
+                    "playing_role": player.get("playingRole"),
+                    "runs": bat.get("runs"),
+                    "balls_faced": bat.get("ballsFaced"),
+                    "fours": bat.get("fours"),
+                    "sixes": bat.get("sixes"),
+                    "strike_rate": bat.get("strikerate") or bat.get("strikeRate"),
+                    "is_not_out": bat.get("isNotOut"),
+                    "batting_position": bat.get("battingPosition"),
+                })
+        return rows
+    except Exception as e:
+        _log.warning(f"    Warning: innings data extraction failed: {e}")
         return []
-    return raw if isinstance(raw, list) else []
 
 
-def _extract_scorecard(page):
+def _extract_scorecard(page, next_data=None):
     """Extract scorecard/metadata from __NEXT_DATA__ when no ball-by-ball data is available."""
-    return page.evaluate(
-        """
-        () => {
-            try {
-                const nd = JSON.parse(document.getElementById('__NEXT_DATA__').textContent);
-                const data = nd.props.appPageProps.data;
-                const match = data.match || {};
-                const content = data.content || {};
-
-                return {
-                    matchId: match.objectId,
-                    title: match.title,
-                    status: match.statusText,
-                    teams: (match.teams || []).map(t => ({
-                        id: t.team?.objectId,
-                        name: t.team?.longName,
-                        abbreviation: t.team?.abbreviation,
-                    })),
-                    innings: (match.innings || []).map(i => ({
-                        inningNumber: i.inningNumber,
-                        team: i.team?.abbreviation,
-                        runs: i.runs,
-                        wickets: i.wickets,
-                        overs: i.overs,
-                    })),
-                    ground: match.ground ? {
-                        name: match.ground.name,
-                        country: match.ground.country?.name,
-                    } : null,
-                    startDate: match.startDate,
-                    format: match.format,
-                };
-            } catch(e) {
-                return { error: e.message };
-            }
+    try:
+        if next_data is None:
+            next_data = _read_next_data(page)
+        match = _page_data(next_data).get("match") or _EMPTY
+        ground = match.get("ground")
+        return {
+            "matchId": match.get("objectId"),
+            "title": match.get("title"),
+            "status": match.get("statusText"),
+            "teams": [
+                {
+                    "id": (t.get("team") or _EMPTY).get("objectId"),
+                    "name": (t.get("team") or _EMPTY).get("longName"),
+                    "abbreviation": (t.get("team") or _EMPTY).get("abbreviation"),
+                }
+                for t in match.get("teams") or _EMPTY_LIST
+            ],
+            "innings": [
+                {
+                    "inningNumber": i.get("inningNumber"),
+                    "team": (i.get("team") or _EMPTY).get("abbreviation"),
+                    "runs": i.get("runs"),
+                    "wickets": i.get("wickets"),
+                    "overs": i.get("overs"),
+                }
+                for i in match.get("innings") or _EMPTY_LIST
+            ],
+            "ground": {
+                "name": ground.get("name"),
+                "country": (ground.get("country") or _EMPTY).get("name"),
+            } if ground else None,
+            "startDate": match.get("startDate"),
+            "format": match.get("format"),
         }
-    """
-    )
+    except Exception as e:
+        return {"error": str(e)}
 
 
 def _dismiss_overlays(page):
     """Remove marketing overlays (CleverTap, cookie banners, ads) that block clicks."""
-    page.evaluate(
-        """
-        () => {
-            // CleverTap overlays
-            const overlays = document.querySelectorAll('.wzrk-overlay, #wzrk_wrapper, [class*="wzrk"]');
-            for (const el of overlays) el.remove();
-            // Cookie/consent banners
-            const banners = document.querySelectorAll('[class*="cookie"], [class*="consent"], [id*="cookie"]');
-            for (const el of banners) el.style.display = 'none';
-            // Google DFP/GPT ad iframes and containers
-            const ads = document.querySelectorAll(
-                'iframe[id^="google_ads"], iframe[src*="doubleclick"], ' +
-                '[id^="div-gpt-ad"], [class*="ad-slot"], [class*="ad-container"], ' +
-                '[data-ad-slot], [class*="sticky-ad"], [class*="adhesion"], ' +
-                '[class*="billboard"], [id*="adhesion"]'
-            );
-            for (const el of ads) el.style.display = 'none';
-        }
-    """
-    )
+    page.evaluate("() => window.__cricinfo.dismissOverlays()")
 
 
-def _find_and_click_innings_button(page):
-    """Find the innings/team filter button and click it via JS (avoids ad misclicks).
-    T20I/ODI pages have a short team abbrev button (e.g. 'PAK').
-    Test pages have a full innings label (e.g. 'AUS 2nd Innings').
-    Returns button info dict with text/style, or None if not found."""
-    return page.evaluate(
-        """
-        () => {
-            const buttons = document.querySelectorAll('button');
-            for (const btn of buttons) {
-                const text = btn.innerText.trim();
-                if (text.includes('Innings')) {
-                    const rect = btn.getBoundingClientRect();
-                    if (rect.height > 10 && rect.width > 30) {
-                        btn.click();
-                        return { text, style: 'test' };
-                    }
-                }
-            }
-            for (const btn of buttons) {
-                const text = btn.innerText.trim();
-                if (/^[A-Z][A-Z0-9-]{1,7}$/.test(text)) {
-                    const rect = btn.getBoundingClientRect();
-                    if (rect.height > 15 && rect.width > 30) {
-                        btn.click();
-                        return { text, style: 'limited' };
-                    }
-                }
-            }
-            return null;
-        }
+def _innings_dropdown(page, op, target=None):
+    """Open the innings dropdown and act on it in one evaluate (see inningsOp).
+
+    op "discover" returns {current, titles}; op "switch" returns
+    {clicked: 'ok'|'not_found'|'no_tippy'}. Either may return
+    {error: 'no_button'|'no_tippy'} if the dropdown could not be opened.
     """
+    return page.evaluate(
+        "(args) => window.__cricinfo.inningsOp(...args)",
+        [op, target, TIPPY_TIMEOUT_MS],
     )
 
 
 def _discover_innings(page):
     """Discover all available innings from the dropdown."""
     try:
-        _dismiss_overlays(page)
-        page.evaluate("window.scrollTo(0, 500)")
-        time.sleep(0.5)
-
-        btn_info = _find_and_click_innings_button(page)
-        if not btn_info:
-            return []
-
-        time.sleep(1.0)
-
-        tippy = page.locator(".tippy-box")
-        if not tippy.count():
+        info = _innings_dropdown(page, "discover")
+        if info.get("error"):
             return []
 
-        items = tippy.locator("li[title]").all()
-        result = []
-        current_title = btn_info["text"]
-        for li in items:
-            title = (li.get_attribute("title") or "").strip()
-            if title:
-                result.append({"title": title})
-
         page.keyboard.press("Escape")
-        time.sleep(0.3)
-
-        # Reorder: put the currently-displayed innings first
-        reordered = []
-        rest = []
-        for item in result:
-            if item["title"] == current_title:
-                reordered.insert(0, item)
-            else:
-                rest.append(item)
-        reordered.extend(rest)
-
+        try:
+            page.wait_for_selector(".tippy-box", state="detached", timeout=TIPPY_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass  # The next inningsOp reopens the dropdown either way
+
+        # Put the currently-displayed innings first
+        current_title = info["current"]
+        titles = info["titles"]
+        reordered = [{"title": t} for t in titles if t == current_title]
+        reordered.extend({"title": t} for t in titles if t != current_title)
         return reordered
     except Exception as e:
-        print(f"  Warning: Innings discovery failed, using fallback: {e}", file=sys.stderr)
+        _log.warning(f"  Warning: Innings discovery failed, using fallback: {e}")
         try:
             page.keyboard.press("Escape")
         except Exception:
@@ -1122,64 +1928,21 @@ def _discover_innings(page):
 def _switch_to_innings(page, target_title):
     """Switch to a specific innings by clicking its dropdown item."""
     for attempt in range(3):
-        _dismiss_overlays(page)
-
-        page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(0.5)
-        page.evaluate("window.scrollTo(0, 500)")
-        time.sleep(0.5)
-
-        btn_info = _find_and_click_innings_button(page)
-        if not btn_info:
+        # Overlay dismiss, scroll, button click, tippy wait and item click
+        # all run in-page (the JS click avoids the tippy closing mid-locator)
+        info = _innings_dropdown(page, "switch", target_title)
+        error = info.get("error")
+        if error == "no_button":
+            # inningsOp already polled for the button; retry straight away
             if attempt < 2:
-                time.sleep(1)
                 continue
             raise Exception("Could not find innings dropdown button")
-
-        time.sleep(1.0)
-
-        tippy = page.locator(".tippy-box")
-        if not tippy.count():
+        if error == "no_tippy":
             if attempt < 2:
-                page.evaluate("window.scrollTo(0, 0)")
-                time.sleep(0.3)
-                page.evaluate("window.scrollTo(0, 400)")
-                time.sleep(0.5)
-                btn_info2 = _find_and_click_innings_button(page)
-                if btn_info2:
-                    time.sleep(1.0)
-                    if page.locator(".tippy-box").count():
-                        tippy = page.locator(".tippy-box")
-                    else:
-                        continue
-                else:
-                    continue
-            else:
-                raise Exception("Tippy dropdown did not appear")
-
-        # Click the target innings item via JS (Playwright locator clicks
-        # are unreliable here — the tippy can close during locator resolution)
-        clicked = page.evaluate(
-            """
-            (target) => {
-                const tippy = document.querySelector('.tippy-box');
-                if (!tippy) return 'no_tippy';
-                const items = tippy.querySelectorAll('li[title]');
-                for (const li of items) {
-                    const title = (li.getAttribute('title') || '').trim();
-                    if (title === target || title.includes(target) || target.includes(title)) {
-                        const div = li.querySelector('div');
-                        if (div) div.click();
-                        else li.click();
-                        return 'ok';
-                    }
-                }
-                return 'not_found';
-            }
-        """,
-            target_title,
-        )
+                continue
+            raise Exception("Tippy dropdown did not appear")
 
+        clicked = info.get("clicked")
         if clicked == "ok":
             return target_title
         elif clicked == "no_tippy":
@@ -1193,58 +1956,83 @@ def _switch_to_innings(page, target_title):
     raise Exception(f"Failed to switch to '{target_title}' after 3 attempts")
 
 
-def flatten_ball(ball):
-    """Flatten a ball dict for tabular output."""
-    pred = ball.get("predictions") or {}
-
-    # Extract dismissal text (structured string)
-    dismissal_text_obj = ball.get("dismissalText") or {}
-    dismissal_text = dismissal_text_obj.get("long") if isinstance(dismissal_text_obj, dict) else None
+# Ball table columns in output order. Most are copied straight from the API
+# comment; the nested ones are derived in balls_to_table.
+BALL_COLUMNS = (
+    "id", "inningNumber", "overNumber", "ballNumber", "oversActual", "oversUnique",
+    "totalRuns", "batsmanRuns", "isFour", "isSix", "isWicket",
+    "dismissalType", "dismissalText",
+    "wides", "noballs", "byes", "legbyes", "penalties",
+    "wagonX", "wagonY", "wagonZone", "pitchLine", "pitchLength",
+    "shotType", "shotControl",
+    "batsmanPlayerId", "bowlerPlayerId", "nonStrikerPlayerId", "outPlayerId",
+    "totalInningRuns", "totalInningWickets",
+    "predicted_score", "win_probability", "event_type", "drs_successful",
+    "title", "timestamp",
+)
 
-    # Extract first event (DRS reviews, dropped catches, etc.)
-    events = ball.get("events") or []
-    first_event = events[0] if events else {}
-    event_type = first_event.get("type")  # e.g. "DRS_REVIEW", "DROPPED_CATCH"
 
-    return {
-        "id": ball.get("id"),
-        "inningNumber": ball.get("inningNumber"),
-        "overNumber": ball.get("overNumber"),
-        "ballNumber": ball.get("ballNumber"),
-        "oversActual": ball.get("oversActual"),
-        "oversUnique": ball.get("oversUnique"),
-        "totalRuns": ball.get("totalRuns"),
-        "batsmanRuns": ball.get("batsmanRuns"),
-        "isFour": ball.get("isFour"),
-        "isSix": ball.get("isSix"),
-        "isWicket": ball.get("isWicket"),
-        "dismissalType": ball.get("dismissalType"),
+def balls_to_table(balls):
+    """Build the ball-by-ball table column by column (no per-ball row dicts)."""
+    # One pass for the fields nested in dismissalText / predictions / events
+    dismissal_text, predicted_score, win_probability, event_type, drs_successful = (
+        [], [], [], [], [])
+    for ball in balls:
+        dt = ball.get("dismissalText") or _EMPTY
+        dismissal_text.append(dt.get("long") if isinstance(dt, dict) else None)
+        pred = ball.get("predictions") or _EMPTY
+        predicted_score.append(pred.get("score"))
+        win_probability.append(pred.get("winProbability"))
+        # First event: DRS reviews, dropped catches, etc.
+        events = ball.get("events") or _EMPTY_LIST
+        first_event = events[0] if events else _EMPTY
+        etype = first_event.get("type")
+        event_type.append(etype)
+        drs_successful.append(first_event.get("isSuccessful") if etype == "DRS_REVIEW" else None)
+
+    derived = {
         "dismissalText": dismissal_text,
-        "wides": ball.get("wides"),
-        "noballs": ball.get("noballs"),
-        "byes": ball.get("byes"),
-        "legbyes": ball.get("legbyes"),
-        "penalties": ball.get("penalties"),
-        "wagonX": ball.get("wagonX"),
-        "wagonY": ball.get("wagonY"),
-        "wagonZone": ball.get("wagonZone"),
-        "pitchLine": ball.get("pitchLine"),
-        "pitchLength": ball.get("pitchLength"),
-        "shotType": ball.get("shotType"),
-        "shotControl": ball.get("shotControl"),
-        "batsmanPlayerId": ball.get("batsmanPlayerId"),
-        "bowlerPlayerId": ball.get("bowlerPlayerId"),
-        "nonStrikerPlayerId": ball.get("nonStrikerPlayerId"),
-        "outPlayerId": ball.get("outPlayerId"),
-        "totalInningRuns": ball.get("totalInningRuns"),
-        "totalInningWickets": ball.get("totalInningWickets"),
-        "predicted_score": pred.get("score"),
-        "win_probability": pred.get("winProbability"),
+        "predicted_score": predicted_score,
+        "win_probability": win_probability,
         "event_type": event_type,
-        "drs_successful": first_event.get("isSuccessful") if event_type == "DRS_REVIEW" else None,
-        "title": ball.get("title"),
-        "timestamp": ball.get("timestamp"),
+        "drs_successful": drs_successful,
+    }
+    return pa.table({
+        name: derived[name] if name in derived else [b.get(name) for b in balls]
+        for name in BALL_COLUMNS
+    })
+
+
+# Monotonic-ish integer ball columns: delta encoding beats dictionary/plain
+DELTA_COLUMNS = ("id", "overNumber", "ballNumber", "totalInningRuns", "timestamp")
+# Per-match files are tens of KB; 1 MB covers all but the longest Tests
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _write_match_parquet(table, outpath):
+    """Atomically write one per-match parquet (temp file + rename).
+
+    These files are only ever read whole (by combine_cricinfo_parquets), so
+    column statistics are skipped and zstd keeps the thousands of small
+    release assets compact. Integer columns in DELTA_COLUMNS are
+    delta-encoded; everything else keeps dictionary encoding.
+    """
+    schema = table.schema
+    delta = {
+        name: "DELTA_BINARY_PACKED" for name in DELTA_COLUMNS
+        if name in schema.names and pa.types.is_integer(schema.field(name).type)
     }
+    tmppath = outpath.with_suffix(".parquet.tmp")
+    # Buffer the page/footer writes so a small file lands in one or two syscalls
+    with pa.OSFile(str(tmppath), "wb") as raw, \
+            pa.BufferedOutputStream(raw, buffer_size=WRITE_BUFFER_BYTES) as sink:
+        pq.write_table(
+            table, sink,
+            compression="zstd", compression_level=3, write_statistics=False,
+            use_dictionary=[name for name in schema.names if name not in delta] if delta else True,
+            column_encoding=delta or None,
+        )
+    tmppath.replace(outpath)
 
 
 def save_all_tables(balls, match_meta, innings_data, match_id, format_dir, output_dir):
@@ -1256,35 +2044,22 @@ def save_all_tables(balls, match_meta, innings_data, match_id, format_dir, outpu
     outdir.mkdir(parents=True, exist_ok=True)
     saved = {}
 
-    import pyarrow as pa
-    import pyarrow.parquet as pq
-
     # Balls table
     if balls:
-        flat = [flatten_ball(b) for b in balls]
-        table = pa.Table.from_pylist(flat)
         outpath = outdir / f"{match_id}_balls.parquet"
-        tmppath = outpath.with_suffix(".parquet.tmp")
-        pq.write_table(table, tmppath)
-        tmppath.replace(outpath)
+        _write_match_parquet(balls_to_table(balls), outpath)
         saved["balls"] = str(outpath)
 
     # Match metadata table (single row)
     if match_meta:
-        table = pa.Table.from_pylist([match_meta])
         outpath = outdir / f"{match_id}_match.parquet"
-        tmppath = outpath.with_suffix(".parquet.tmp")
-        pq.write_table(table, tmppath)
-        tmppath.replace(outpath)
+        _write_match_parquet(pa.Table.from_pylist([match_meta]), outpath)
         saved["match"] = str(outpath)
 
     # Innings table (one row per batsman per innings)
     if innings_data:
-        table = pa.Table.from_pylist(innings_data)
         outpath = outdir / f"{match_id}_innings.parquet"
-        tmppath = outpath.with_suffix(".parquet.tmp")
-        pq.write_table(table, tmppath)
-        tmppath.replace(outpath)
+        _write_match_parquet(pa.Table.from_pylist(innings_data), outpath)
         saved["innings"] = str(outpath)
 
     return saved
@@ -1302,84 +2077,244 @@ FIXTURE_COLUMNS = [
     "has_ball_by_ball",
 ]
 
+# Every fixture field is a string except the scraped flag
+FIXTURE_SCHEMA = pa.schema(
+    [(col, pa.string()) for col in FIXTURE_COLUMNS[:-1]] + [("has_ball_by_ball", pa.bool_())]
+)
+
+
+# Fixtures are mostly short, highly repetitive strings (format, gender,
+# status, team abbreviations): zstd over dictionary pages, with row groups
+# small enough that their statistics let filtered reads skip most of them
+FIXTURE_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "row_group_size": 8192,
+    "data_page_size": 256 * 1024,
+    "write_statistics": True,
+}
+
+# Fixture checkpoints are written as small delta files beside the main
+# fixtures parquet and folded into it by compact_fixtures(), so a checkpoint
+# costs O(new rows) instead of a full read-merge-rewrite of the table.
+MAX_FIXTURE_DELTAS = 16
+
+
+def _fixtures_path(output_dir, fixtures_file=None):
+    """Path of the main fixtures parquet."""
+    return Path(fixtures_file) if fixtures_file else Path(output_dir) / "fixtures.parquet"
+
+
+def _fixtures_delta_dir(outpath):
+    """Delta directory for a fixtures file.
+
+    The leading underscore keeps it out of combine_cricinfo_parquets.py's
+    format_gender directory scan.
+    """
+    return outpath.parent / f"_{outpath.stem}_delta"
+
+
+def _list_fixture_deltas(outpath):
+    """Pending delta files for a fixtures file, oldest first."""
+    delta_dir = _fixtures_delta_dir(outpath)
+    if not delta_dir.exists():
+        return []
+    return sorted(delta_dir.glob("*.parquet"))
+
+
+def _dedupe_fixtures(table):
+    """Keep the latest row per match_id (first-seen order); has_ball_by_ball is sticky."""
+    hbb = pc.fill_null(table.column("has_ball_by_ball").cast(pa.bool_()), False)
+    keys = pa.table({
+        "match_id": table.column("match_id").cast(pa.string()),
+        "row": pa.array(range(table.num_rows), type=pa.int64()),
+        "has_ball_by_ball": hbb,
+    })
+    grouped = keys.group_by("match_id").aggregate([
+        ("row", "min"), ("row", "max"), ("has_ball_by_ball", "any"),
+    ]).sort_by("row_min")
+    table = table.take(grouped.column("row_max"))
+    return table.set_column(
+        table.schema.get_field_index("has_ball_by_ball"),
+        "has_ball_by_ball", grouped.column("has_ball_by_ball_any"),
+    )
+
+
+def _read_fixtures_table(outpath, columns=None, filter=None):
+    """Read the fixtures table: main file plus any pending deltas.
+
+    Later deltas win per match_id. An optional compute expression `filter`
+    is pushed down into the parquet scan when there are no deltas; with
+    deltas it is applied after dedup, since a later delta may flip a row.
+    Returns (table, delta_paths); table is None when no fixtures exist yet.
+    Read errors propagate to the caller.
+    """
+    deltas = _list_fixture_deltas(outpath)
+    sources = ([outpath] if outpath.exists() else []) + deltas
+    if not sources:
+        return None, deltas
+
+    if not deltas:
+        return pq.read_table(sources[0], columns=columns, filters=filter), deltas
+
+    read_cols = columns
+    if columns is not None:
+        if filter is not None:
+            # The filter may reference columns outside the projection
+            read_cols = None
+        else:
+            # Dedup needs the key and the sticky flag
+            read_cols = list(dict.fromkeys([*columns, "match_id", "has_ball_by_ball"]))
+    tables = [pq.read_table(src, columns=read_cols) for src in sources]
+    table = _dedupe_fixtures(pa.concat_tables(tables, promote_options="permissive"))
+    if filter is not None:
+        table = table.filter(filter)
+    if columns is not None:
+        table = table.select(columns)
+    return table, deltas
+
+
+def _write_fixtures_parquet(table, outpath):
+    """Durably write a fixtures parquet: temp file, fsync, rename, fsync dir.
+
+    A bare write+rename can leave a zero-length file after a power loss on
+    delayed-allocation filesystems (ext4, XFS), which would cost the whole
+    fixtures table. Per-match files skip this; they are cheap to re-scrape.
+    """
+    tmppath = outpath.with_suffix(".parquet.tmp")
+    with open(tmppath, "wb") as f:
+        pq.write_table(table, f, **FIXTURE_WRITE_OPTIONS)
+        f.flush()
+        os.fsync(f.fileno())
+    tmppath.replace(outpath)
+    if hasattr(os, "O_DIRECTORY"):
+        # Persist the rename itself (POSIX only)
+        dir_fd = os.open(outpath.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _write_fixtures_table(table, outpath, consumed_deltas=()):
+    """Atomically replace the main fixtures file, then drop the deltas it absorbed."""
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    _write_fixtures_parquet(table, outpath)
+    # Deltas go only after the main file holds their rows; re-applying a
+    # leftover delta after a crash is harmless
+    for delta in consumed_deltas:
+        delta.unlink(missing_ok=True)
+
+
+def compact_fixtures(output_dir, fixtures_file=None):
+    """Fold pending fixture deltas into the main fixtures parquet.
+
+    Returns the main file path, or None if nothing was written.
+    """
+    outpath = _fixtures_path(output_dir, fixtures_file)
+    if not _list_fixture_deltas(outpath):
+        return None
+    try:
+        table, deltas = _read_fixtures_table(outpath)
+        _write_fixtures_table(table, outpath, deltas)
+        return str(outpath)
+    except Exception as e:
+        print(f"  Warning: Could not compact fixtures (deltas kept for next run): {e}", file=sys.stderr)
+        return None
+
 
 def _load_known_series(output_dir, fixtures_file=None):
     """Load set of series_ids already present in fixtures.parquet."""
-    import pyarrow.parquet as pq
-    outpath = Path(fixtures_file) if fixtures_file else Path(output_dir) / "fixtures.parquet"
-    if not outpath.exists():
-        return set()
+    outpath = _fixtures_path(output_dir, fixtures_file)
     try:
-        col = pq.read_table(outpath, columns=["series_id"]).column("series_id")
-        return {str(v.as_py()) for v in col}
+        table, _ = _read_fixtures_table(outpath, columns=["series_id"])
+        if table is None:
+            return set()
+        # Box only the distinct ids, not one per fixture row
+        return set(pc.unique(table.column("series_id").cast(pa.string())).to_pylist())
     except Exception as e:
         print(f"  Warning: Could not read fixtures for known series (will re-discover all): {e}", file=sys.stderr)
         return set()
 
 
+MATCH_DIRS = ("t20i_male", "t20i_female", "odi_male", "odi_female", "test_male", "test_female")
+
+
+def _scan_match_files(output_dir):
+    """One listing of every format dir -> (ids with balls, ids with match metadata)."""
+    balls_ids, meta_ids = set(), set()
+    for fmt_dir in MATCH_DIRS:
+        try:
+            entries = os.scandir(Path(output_dir) / fmt_dir)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                match_id, _, rest = entry.name.partition("_")
+                if rest.startswith("balls."):
+                    balls_ids.add(match_id)
+                elif rest.startswith("match."):
+                    meta_ids.add(match_id)
+    return balls_ids, meta_ids
+
+
 def _get_scraped_match_ids(output_dir):
     """Scan output directories for match IDs that already have _balls.parquet files."""
-    scraped = set()
-    for fmt_dir in ["t20i_male", "t20i_female", "odi_male", "odi_female", "test_male", "test_female"]:
-        d = Path(output_dir) / fmt_dir
-        if d.exists():
-            for f in d.glob("*_balls.parquet"):
-                match_id = f.stem.replace("_balls", "")
-                scraped.add(match_id)
-    return scraped
+    return _scan_match_files(output_dir)[0]
+
+
+UNSCRAPED_FIXTURE_COLUMNS = ["match_id", "format", "series_id", "series_name", "gender"]
 
 
 def load_unscraped_fixtures(output_dir, format_filter=None, fixtures_file=None):
     """Load completed fixtures that need ball-by-ball scraping.
 
-    Reads fixtures.parquet, filters for completed matches without ball-by-ball
-    data (checking both the fixtures flag and filesystem), groups by series.
+    Reads fixtures.parquet with the status/flag/format predicate pushed down
+    into the scan, drops matches already on disk, groups by series.
 
     Returns dict of series_id -> {series_name, format, gender, match_ids: [str]}
     """
-    import pyarrow.parquet as pq
-
-    outpath = Path(fixtures_file) if fixtures_file else Path(output_dir) / "fixtures.parquet"
-    if not outpath.exists():
-        return {}
-
+    outpath = _fixtures_path(output_dir, fixtures_file)
+    # Completed matches without ball-by-ball (null flag counts as unscraped)
+    unscraped = pc.field("status").isin(["FINISHED", "POST"]) & (
+        pc.field("has_ball_by_ball").is_null() | (pc.field("has_ball_by_ball") == False)  # noqa: E712
+    )
+    if format_filter:
+        unscraped = unscraped & (pc.field("format") == format_filter)
     try:
-        table = pq.read_table(outpath)
+        table, _ = _read_fixtures_table(
+            outpath, columns=UNSCRAPED_FIXTURE_COLUMNS, filter=unscraped
+        )
     except Exception as e:
         print(f"Error reading fixtures.parquet: {e}", file=sys.stderr)
         return {}
+    if table is None:
+        return {}
 
     # Check filesystem for matches already scraped (handles stale has_ball_by_ball flags)
     fs_scraped = _get_scraped_match_ids(output_dir)
 
+    # One bulk conversion per column, then a plain zip over the rows
+    cols = table.to_pydict()
     series_matches = {}
-    for i in range(table.num_rows):
-        row = {col: table.column(col)[i].as_py() for col in table.column_names}
-
-        # Only completed matches
-        if row.get("status") not in ("FINISHED", "POST"):
-            continue
-
-        # Skip if already has ball-by-ball (fixture flag or filesystem)
-        if row.get("has_ball_by_ball"):
-            continue
-        match_id = str(row.get("match_id", ""))
+    for match_id, fmt, series_id, series_name, gender in zip(
+        *(cols[c] for c in UNSCRAPED_FIXTURE_COLUMNS)
+    ):
+        # Status, flag and format were filtered in the scan
+        match_id = str(match_id)
         if match_id in fs_scraped:
             continue
 
-        # Format filter
-        if format_filter and row.get("format") != format_filter:
-            continue
-
-        series_id = str(row.get("series_id", ""))
+        series_id = str(series_id) if series_id is not None else ""
         if not series_id:
             continue
 
         if series_id not in series_matches:
             series_matches[series_id] = {
-                "series_name": row.get("series_name", ""),
-                "format": row.get("format", ""),
-                "gender": row.get("gender", "male"),
+                "series_name": series_name,
+                "format": fmt,
+                "gender": gender,
                 "match_ids": [],
             }
         series_matches[series_id]["match_ids"].append(match_id)
@@ -1388,129 +2323,291 @@ def load_unscraped_fixtures(output_dir, format_filter=None, fixtures_file=None):
 
 
 def save_fixtures(all_fixtures, output_dir, fixtures_file=None):
-    """Save/update fixtures.parquet with all discovered matches.
+    """Checkpoint discovered fixtures.
 
-    Merges new fixtures with any existing file, deduplicating by match_id
-    (latest status wins for updated matches).
+    Writes only the given rows as a delta file beside fixtures.parquet. Deltas
+    are merged into the main file (deduplicated by match_id, latest status
+    wins, has_ball_by_ball preserved) by compact_fixtures(), which runs once
+    MAX_FIXTURE_DELTAS accumulate and when main() exits, however it exits
+    (short of SIGKILL).
     """
-    import pyarrow as pa
-    import pyarrow.parquet as pq
-
-    outpath = Path(fixtures_file) if fixtures_file else Path(output_dir) / "fixtures.parquet"
+    outpath = _fixtures_path(output_dir, fixtures_file)
 
-    # Normalize fixtures to consistent schema
-    normalized = []
-    for f in all_fixtures:
-        row = {col: f.get(col, "") for col in FIXTURE_COLUMNS}
-        # has_ball_by_ball defaults to False, will be updated later
-        if row["has_ball_by_ball"] == "":
-            row["has_ball_by_ball"] = False
-        normalized.append(row)
-
-    if not normalized:
+    if not all_fixtures:
         return
 
-    # Load existing fixtures if present
-    existing = {}
-    if outpath.exists():
-        try:
-            old_table = pq.read_table(outpath)
-            for i in range(old_table.num_rows):
-                mid = str(old_table.column("match_id")[i].as_py())
-                row = {}
-                for col in old_table.column_names:
-                    row[col] = old_table.column(col)[i].as_py()
-                existing[mid] = row
-        except Exception as e:
-            print(f"  Warning: Could not read existing fixtures.parquet: {e}", file=sys.stderr)
-            print(f"  SKIPPING save to avoid data loss (file may be locked by sync)", file=sys.stderr)
-            return None  # Don't overwrite with partial data
-
-    # Merge: new fixtures overwrite existing (by match_id)
-    for row in normalized:
-        mid = row["match_id"]
-        if mid in existing:
-            # Preserve has_ball_by_ball from existing if new doesn't set it
-            old = existing[mid]
-            if old.get("has_ball_by_ball") and not row.get("has_ball_by_ball"):
-                row["has_ball_by_ball"] = old["has_ball_by_ball"]
-        existing[mid] = row
-
-    # Write merged fixtures
-    all_rows = list(existing.values())
-    # Ensure all rows have all columns
-    for row in all_rows:
-        for col in FIXTURE_COLUMNS:
-            if col not in row:
-                row[col] = False if col == "has_ball_by_ball" else ""
+    # Normalize straight into typed columns; no schema inference pass
+    cols = {col: [f.get(col, "") for f in all_fixtures] for col in FIXTURE_COLUMNS[:-1]}
+    # has_ball_by_ball defaults to False, will be updated later
+    cols["has_ball_by_ball"] = [bool(f.get("has_ball_by_ball")) for f in all_fixtures]
 
     try:
-        table = pa.Table.from_pylist(all_rows)
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
-        # Atomic write: write to temp file then rename to avoid corruption
-        tmppath = outpath.with_suffix(".parquet.tmp")
-        pq.write_table(table, tmppath)
-        tmppath.replace(outpath)
-        return str(outpath)
+        delta_dir = _fixtures_delta_dir(outpath)
+        delta_dir.mkdir(parents=True, exist_ok=True)
+        # Zero-padded ns timestamp: lexical order == write order
+        deltapath = delta_dir / f"{time.time_ns():020d}.parquet"
+        _write_fixtures_parquet(pa.Table.from_pydict(cols, schema=FIXTURE_SCHEMA), deltapath)
     except Exception as e:
-        print(f"  Warning: Failed to write fixtures.parquet: {e}", file=sys.stderr)
+        print(f"  Warning: Failed to write fixtures delta: {e}", file=sys.stderr)
         return None
 
+    if len(_list_fixture_deltas(outpath)) > MAX_FIXTURE_DELTAS:
+        compact_fixtures(output_dir, fixtures_file=fixtures_file)
+    return str(outpath)
+
 
 def mark_fixtures_scraped(output_dir, match_ids, fixtures_file=None):
     """Update has_ball_by_ball=True for scraped match IDs in fixtures.parquet."""
-    import pyarrow as pa
-    import pyarrow.parquet as pq
-
-    outpath = Path(fixtures_file) if fixtures_file else Path(output_dir) / "fixtures.parquet"
-    if not outpath.exists() or not match_ids:
+    outpath = _fixtures_path(output_dir, fixtures_file)
+    if not match_ids:
         return
 
     try:
-        table = pq.read_table(outpath)
-        rows = []
-        scraped_set = set(str(mid) for mid in match_ids)
-        for i in range(table.num_rows):
-            row = {}
-            for col in table.column_names:
-                row[col] = table.column(col)[i].as_py()
-            if str(row.get("match_id")) in scraped_set:
-                row["has_ball_by_ball"] = True
-            rows.append(row)
-        # Atomic write: temp file then rename to avoid corruption on crash
-        tmppath = outpath.with_suffix(".parquet.tmp")
-        pq.write_table(pa.Table.from_pylist(rows), tmppath)
-        tmppath.replace(outpath)
+        scraped_arr = pa.array({str(mid) for mid in match_ids}, type=pa.string())
+        if not _list_fixture_deltas(outpath):
+            # Check the key and flag first; if every match is already flagged
+            # the other columns never get decoded or rewritten
+            flags, _ = _read_fixtures_table(outpath, columns=["match_id", "has_ball_by_ball"])
+            if flags is None:
+                return
+            mask = pc.is_in(flags.column("match_id").cast(pa.string()), value_set=scraped_arr)
+            hbb = pc.fill_null(flags.column("has_ball_by_ball").cast(pa.bool_()), False)
+            if not pc.any(pc.and_(mask, pc.invert(hbb))).as_py():
+                return
+
+        # Reads pending deltas too, so this rewrite also compacts them
+        table, deltas = _read_fixtures_table(outpath)
+        if table is None:
+            return
+        mask = pc.is_in(table.column("match_id").cast(pa.string()), value_set=scraped_arr)
+        hbb = pc.fill_null(table.column("has_ball_by_ball").cast(pa.bool_()), False)
+        table = table.set_column(
+            table.schema.get_field_index("has_ball_by_ball"),
+            "has_ball_by_ball", pc.or_(hbb, mask),
+        )
+        _write_fixtures_table(table, outpath, deltas)
     except Exception as e:
         print(f"  Warning: Failed to update fixtures with scraped status: {e}", file=sys.stderr)
 
 
 def _infer_gender(name):
     """Infer gender from series name."""
-    if not name:
-        return "male"
-    lower = name.lower()
-    if any(kw in lower for kw in ("women", "female", "wbbl", "wpl", "wodi", "wt20", "women's")):
-        return "female"
-    return "male"
+    return "female" if name and _FEMALE_RE.search(name) else "male"
 
 
 def load_series_list(series_list_path, format_filter=None, max_series=10):
     """Load series from series_list.csv, filtered by format."""
-    series = []
-    with open(series_list_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if format_filter and row.get("format") != format_filter:
-                continue
-            # Infer gender if not in CSV
-            if not row.get("gender"):
-                row["gender"] = _infer_gender(row.get("name", ""))
-            series.append(row)
+    with open(series_list_path, "r", encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return []
+    # Every column as string, like csv.DictReader (series_id stays "12345")
+    table = pacsv.read_csv(
+        series_list_path,
+        convert_options=pacsv.ConvertOptions(column_types={col: pa.string() for col in header}),
+    )
+    if format_filter:
+        table = table.filter(pc.equal(table.column("format"), format_filter))
 
     # Most recent first (higher series_id = newer)
-    series.sort(key=lambda s: int(s.get("series_id", 0)), reverse=True)
-    return series[:max_series]
+    table = table.take(
+        pc.array_sort_indices(pc.cast(table.column("series_id"), pa.int64()), order="descending")
+    )
+    series = table.slice(0, max_series).to_pylist()
+    for row in series:
+        # Infer gender if not in CSV
+        if not row.get("gender"):
+            row["gender"] = _infer_gender(row.get("name", ""))
+    return series
+
+
+def _new_run_stats():
+    """Run totals shared by the main thread and any --workers threads."""
+    return {"lock": threading.Lock(), "matches": 0, "balls": 0, "rich": 0,
+            "scraped_ids": []}
+
+
+# Parquet encoding + writes run here so scraping overlaps with them. One
+# thread keeps writes ordered; main() drains it before touching fixtures.
+_write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parquet-writer")
+
+
+def _save_match(result, match_id, format_dir, output_dir, stats, tag, elapsed, error_fields):
+    """Writer-thread job: save a scraped match's tables and record it in stats."""
+    balls = result["balls"]
+    try:
+        saved = save_all_tables(
+            balls, result.get("match_meta"), result.get("innings_data"),
+            match_id, format_dir, output_dir
+        )
+    except Exception as e:
+        print(f"    {tag}ERROR saving {match_id}: {e}")
+        log_scrape_error(
+            output_dir,
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            match_id=match_id,
+            error_type="match_error",
+            error_message=str(e)[:200],
+            **error_fields,
+        )
+        return
+    tables_saved = list(saved.keys())
+    if balls:
+        rich = sum(
+            1 for b in balls if b.get("wagonX") is not None
+        )
+        label = "hawkeye" if result["has_hawkeye"] else "basic"
+        print(
+            f"    {tag}-> Saved {len(balls)} balls ({rich} {label}) + tables {tables_saved} to {format_dir}/ [{elapsed:.0f}s]"
+        )
+        with stats["lock"]:
+            stats["matches"] += 1
+            stats["balls"] += len(balls)
+            stats["rich"] += rich
+            stats["scraped_ids"].append(match_id)
+    else:
+        print(
+            f"    {tag}-> Saved metadata only (tables {tables_saved}) to {format_dir}/ [{elapsed:.0f}s]"
+        )
+
+
+def _scrape_one_match(browser, context, page, match, series_info, fmt, gender,
+                      max_innings, output_dir, stats, tag="", fetch_html=False):
+    """Scrape one match, save its tables and record the outcome in stats.
+
+    Used by both the serial loop and --workers threads. ``tag`` prefixes
+    result lines so interleaved worker output can be attributed. Returns
+    the page to use for the next match: the same tab, or a replacement if
+    this one died.
+    """
+    match_id = match["match_id"]
+    series_id, series_name = series_info["series_id"], series_info.get("name", "")
+    teams = " vs ".join(match["teams"][:2])
+    match_url = _MATCH_URL(match["series_slug"], match["slug"], match_id)
+
+    try:
+        t0 = time.time()
+        result = scrape_match_commentary(
+            browser, context, page, match_url, max_innings=max_innings,
+            fetch_html=fetch_html,
+        )
+        elapsed = time.time() - t0
+
+        balls, match_meta, innings_data = (
+            result["balls"], result.get("match_meta"), result.get("innings_data"))
+        detected_fmt, detected_gender = (
+            result.get("detected_format"), result.get("detected_gender"))
+
+        # Use detected format/gender, fall back to CSV values
+        save_fmt = detected_fmt or fmt
+        save_gender = detected_gender or gender
+        if not save_gender:
+            save_gender = "male"
+            print(f"    {tag}WARNING: Could not detect gender, defaulting to 'male'")
+        format_dir = f"{save_fmt}_{save_gender}"
+
+        if detected_fmt and detected_fmt != fmt:
+            print(f"    {tag}(auto-detected format: {detected_fmt}, CSV said: {fmt})")
+
+        if balls or match_meta or innings_data:
+            # Encode/write on the writer thread; this tab moves on to the next match
+            _write_pool.submit(
+                _save_match, result, match_id, format_dir, output_dir, stats, tag, elapsed,
+                error_fields={"series_id": series_id, "series_name": series_name,
+                              "format": save_fmt, "teams": teams},
+            )
+        elif result.get("scorecard"):
+            sc = result["scorecard"]
+            print(
+                f"    {tag}-> Scorecard only: {sc.get('title', 'unknown')} [{elapsed:.0f}s]"
+            )
+        else:
+            print(f"    {tag}No data found [{elapsed:.0f}s]")
+
+        # Log any innings failures to CSV
+        for fail in result.get("innings_failures", []):
+            log_scrape_error(
+                output_dir,
+                timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                match_id=match_id,
+                series_id=series_id,
+                series_name=series_name,
+                format=save_fmt,
+                teams=teams,
+                innings_expected=result.get("innings_expected", ""),
+                innings_scraped=result.get("innings_scraped", ""),
+                failed_innings=fail["innings"],
+                error_type=fail["error_type"],
+                error_message=fail["error_message"][:200],
+            )
+    except Exception as e:
+        print(f"    {tag}ERROR: {e}")
+        log_scrape_error(
+            output_dir,
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            match_id=match_id,
+            series_id=series_id,
+            series_name=series_name,
+            format=fmt,
+            teams=teams,
+            error_type="match_error",
+            error_message=str(e)[:200],
+        )
+
+    # Drop the match page so renderer memory stays flat across the run
+    # (nothing to drop if --fetch-html never left the light page)
+    if page.is_closed() or (page.url != _LIGHT_PAGE_URL and not _release_page(page)):
+        print(f"    {tag}Replacing unresponsive tab")
+        return _replace_page(context, page)
+    return page
+
+
+def _match_worker(tasks, launch_opts, pidfile_dir, stats):
+    """Thread target for --workers: scrape queued matches until a None sentinel.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    worker runs its own playwright instance, browser, context and page.
+    """
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**launch_opts)
+        _register_browser(browser, pidfile_dir=pidfile_dir)
+        try:
+            context = _new_context(browser)
+            page = context.new_page()
+            while True:
+                task = tasks.get()
+                try:
+                    if task is None:
+                        break
+                    page = _scrape_one_match(browser, context, page, stats=stats, **task)
+                finally:
+                    tasks.task_done()
+        finally:
+            _retry_contexts.pop(browser, None)
+            _unregister_browser(browser)
+            _kill_browser(browser)
+
+
+def _wait_for_tasks(tasks, workers):
+    """Block until all queued matches are done; fail if every worker has died."""
+    while tasks.unfinished_tasks:
+        if not any(w.is_alive() for w in workers):
+            raise RuntimeError("All match workers exited with matches still queued")
+        time.sleep(0.2)
+
+
+def _configure_logging(level):
+    """Send scraper log records to stdout (below WARNING) and stderr, message only."""
+    fmt = logging.Formatter("%(message)s")
+    out = logging.StreamHandler(sys.stdout)
+    out.setFormatter(fmt)
+    out.addFilter(lambda record: record.levelno < logging.WARNING)
+    err = logging.StreamHandler(sys.stderr)
+    err.setFormatter(fmt)
+    err.setLevel(logging.WARNING)
+    _log.addHandler(out)
+    _log.addHandler(err)
+    _log.setLevel(level)
 
 
 def main():
@@ -1562,6 +2659,13 @@ def main():
         action="store_true",
         help="Use build_series_list() to auto-discover series from parquets + CSV",
     )
+    parser.add_argument(
+        "--fetch-html",
+        action="store_true",
+        help="Read match pages by fetching their HTML in-page instead of rendering "
+             "them; falls back to a full page load when that is not enough "
+             "(e.g. the commentary API fails). Experimental.",
+    )
     parser.add_argument(
         "--fixtures-only",
         action="store_true",
@@ -1582,12 +2686,41 @@ def main():
         help="Custom path to fixtures parquet file (default: {output_dir}/fixtures.parquet). "
              "Useful for running parallel scrapers per format without write conflicts.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scrape matches in N parallel browsers (default: 1). Keep to 2-4 "
+             "to stay polite to Cricinfo.",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=REQUEST_RATE,
+        help=f"Sustained Cricinfo requests per second across all workers, after a "
+             f"burst of {REQUEST_BURST} (default: {REQUEST_RATE}; 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Verbosity of per-page diagnostics (default: INFO; WARNING hides "
+             "per-innings lines)",
+    )
     args = parser.parse_args()
+    _bucket.configure(REQUEST_BURST, args.rate)
+    _configure_logging(args.log_level)
 
     output_dir = Path(args.output_dir)
     series_list_path = Path(args.series_list)
     fixtures_file = args.fixtures_file
 
+    # Checkpoints only reach fixtures.parquet (the file CI uploads) once
+    # compacted, so fold them in on any exit: normal return, exception, or
+    # SIGINT/SIGTERM (the signal handlers exit via sys.exit, which runs atexit)
+    _install_handlers_once()
+    atexit.register(compact_fixtures, output_dir, fixtures_file=fixtures_file)
+
     target_match_ids = None  # Set by --from-fixtures to filter within series
 
     # Determine which series to scrape
@@ -1678,7 +2811,12 @@ def main():
 
     # Skip series already in fixtures.parquet (if --skip-known)
     if args.skip_known:
-        known_series = _load_known_series(output_dir)
+        if args.from_fixtures:
+            # Every target came out of the fixtures read above, so it is known
+            # by definition; no need to decode the file a second time
+            known_series = set(unscraped)
+        else:
+            known_series = _load_known_series(output_dir, fixtures_file=fixtures_file)
         before = len(target_series)
         target_series = [s for s in target_series if s["series_id"] not in known_series]
         skipped = before - len(target_series)
@@ -1712,18 +2850,15 @@ def main():
     if args.system_chrome:
         launch_opts["channel"] = "chrome"
 
-    all_fixtures = []  # Collect fixtures across all series
-    scraped_match_ids = []  # Track successfully scraped matches
+    # Fixture totals across all series (the rows themselves go straight to deltas)
+    fixture_total = 0
+    fixture_upcoming = 0
+    stats = _new_run_stats()  # Track successfully scraped matches
 
     with sync_playwright() as p:
         browser = p.chromium.launch(**launch_opts)
         _register_browser(browser, pidfile_dir=str(output_dir))
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            locale="en-US",
-        )
-        stealth.apply_stealth_sync(context)
-
+        context = _new_context(browser)
         page = context.new_page()
 
         # --fixtures-only: fast path using in-browser fetch()
@@ -1739,22 +2874,27 @@ def main():
             start_time = time.time()
             pending_fixtures = []  # Batch for periodic save
 
+            batch_results = {}  # index -> fixtures for the current in-flight batch
             for i, series_info in enumerate(target_series):
                 series_id = series_info["series_id"]
-                fmt = series_info.get("format", "t20i")
-                gender = series_info.get("gender", "male")
                 name = series_info.get("name", "")
-                url = series_info.get("url") or f"https://www.espncricinfo.com/series/{series_id}"
 
-                fixtures = fetch_fixtures_fast(
-                    page, url, series_id,
-                    series_name=name, series_format=fmt, series_gender=gender,
-                )
+                if i not in batch_results:
+                    # Fetch the next FIXTURE_FETCH_PARALLEL series concurrently
+                    batch = target_series[i:i + FIXTURE_FETCH_PARALLEL]
+                    batch_results = dict(enumerate(fetch_fixtures_batch(page, [
+                        (
+                            s.get("url") or f"https://www.espncricinfo.com/series/{s['series_id']}",
+                            s["series_id"], s.get("name", ""),
+                            s.get("format", "t20i"), s.get("gender", "male"),
+                        )
+                        for s in batch
+                    ]), start=i))
+                fixtures = batch_results.pop(i)
 
                 if fixtures:
                     success += 1
                     total_fixtures_count += len(fixtures)
-                    all_fixtures.extend(fixtures)
                     pending_fixtures.extend(fixtures)
                     upcoming = sum(1 for f in fixtures if f["status"] not in ("FINISHED", "POST"))
                     print(f"  [{i+1}/{len(target_series)}] {series_id}: {name[:55]} -> {len(fixtures)} ({upcoming} upcoming)")
@@ -1772,11 +2912,11 @@ def main():
                     rate = (i + 1) / elapsed
                     print(f"\n  --- Progress: {i+1}/{len(target_series)} ({rate:.1f}/sec), "
                           f"{success} ok, {errors} empty, {total_fixtures_count} fixtures ---\n")
-                    time.sleep(0.3)
 
-            # Final save for any remaining
+            # Final save for any remaining, then fold deltas into fixtures.parquet
             if pending_fixtures:
                 save_fixtures(pending_fixtures, output_dir, fixtures_file=fixtures_file)
+            compact_fixtures(output_dir, fixtures_file=fixtures_file)
 
             elapsed = time.time() - start_time
             print(f"\n{'='*60}")
@@ -1788,13 +2928,37 @@ def main():
             _cleanup_browser()
             return
 
-        total_matches = 0
-        total_balls = 0
-        total_rich = 0
         series_since_recycle = 0
         RECYCLE_EVERY = 20  # Recycle browser context every N series to free RAM
 
+        # --workers N: scrape matches in N parallel browsers; the main page
+        # keeps doing series discovery, queueing matches run-wide so workers
+        # never idle while the next series' schedule loads
+        tasks = None
+        workers = []
+        if args.workers > 1:
+            tasks = queue.Queue()
+            for _ in range(args.workers):
+                w = threading.Thread(
+                    target=_match_worker,
+                    args=(tasks, launch_opts, str(output_dir), stats),
+                    daemon=True,
+                )
+                w.start()
+                workers.append(w)
+            print(f"Started {args.workers} match workers")
+
+        # Existing per-match files, listed once per run instead of globbing
+        # every format dir for every match; queued_ids covers this run's own
+        # matches (a match can appear under more than one series)
+        existing_balls, existing_meta = (
+            _scan_match_files(output_dir) if not args.force else (set(), set()))
+        queued_ids = set()
+
         for series_info in target_series:
+            if workers and not any(w.is_alive() for w in workers):
+                raise RuntimeError("All match workers exited with matches still queued")
+
             # Periodically recycle context to prevent Chrome memory bloat
             series_since_recycle += 1
             if series_since_recycle > RECYCLE_EVERY:
@@ -1802,36 +2966,39 @@ def main():
                     context.close()
                 except Exception as e:
                     print(f"  Warning: context.close() failed during recycling: {e}", file=sys.stderr)
-                context = browser.new_context(
-                    viewport={"width": 1280, "height": 900},
-                    locale="en-US",
-                )
-                stealth.apply_stealth_sync(context)
+                context = _new_context(browser)
                 page = context.new_page()
                 series_since_recycle = 0
 
-            series_id = series_info["series_id"]
-            fmt = series_info.get("format", "t20i")
-            gender = series_info.get("gender", "male")
+            series_id, fmt, gender, series_name, series_url = (
+                series_info["series_id"],
+                series_info.get("format", "t20i"),
+                series_info.get("gender", "male"),
+                series_info.get("name"),
+                series_info.get("url") or None,
+            )
             max_innings = int(
                 series_info.get("max_innings", 4 if fmt == "test" else 2)
             )
             print(f"\n{'='*60}")
-            print(f"Series: {series_info['name']} (id={series_id}, format={fmt}, gender={gender})")
+            print(f"Series: {series_name} (id={series_id}, format={fmt}, gender={gender})")
             print(f"{'='*60}")
 
             finished_matches, series_fixtures = discover_matches(
                 page, series_id,
-                series_url=series_info.get("url") or None,
-                series_name=series_info.get("name"),
+                series_url=series_url,
+                series_name=series_name,
                 series_format=fmt,
                 series_gender=gender,
             )
 
-            # Save fixtures incrementally (survives crashes/timeouts)
+            # Checkpoint fixtures as a delta; compacted into fixtures.parquet at
+            # exit (atexit, also on SIGINT/SIGTERM), so an interrupted run keeps them
             if series_fixtures:
-                all_fixtures.extend(series_fixtures)
-                upcoming_count = sum(1 for f in series_fixtures if f["status"] not in ("FINISHED", "POST"))
+                # discover_matches returns one scrape entry per FINISHED/POST fixture
+                upcoming_count = len(series_fixtures) - len(finished_matches)
+                fixture_total += len(series_fixtures)
+                fixture_upcoming += upcoming_count
                 print(f"  Fixtures: {len(series_fixtures)} total ({upcoming_count} upcoming)")
                 save_fixtures(series_fixtures, output_dir, fixtures_file=fixtures_file)
 
@@ -1842,7 +3009,6 @@ def main():
 
             if not finished_matches:
                 print(f"  No completed matches to scrape")
-                time.sleep(0.5)  # Throttle between series to avoid rate limiting
                 continue
 
             print(f"  Found {len(finished_matches)} completed matches")
@@ -1850,127 +3016,63 @@ def main():
 
             for match in finished_matches:
                 match_id = match["match_id"]
-                teams = " vs ".join(match["teams"][:2])
-                print(f"\n  Match {match_id}: {teams}")
+                if match_id in queued_ids:
+                    continue
 
                 # Skip if already scraped in ANY format dir (unless --force)
                 if not args.force:
-                    already_scraped = False
-                    has_metadata = False
-                    for check_fmt in ["t20i_male", "t20i_female", "odi_male", "odi_female", "test_male", "test_female"]:
-                        check_dir = output_dir / check_fmt
-                        if check_dir.exists():
-                            if list(check_dir.glob(f"{match_id}_balls.*")):
-                                already_scraped = True
-                                break
-                            if list(check_dir.glob(f"{match_id}_match.*")):
-                                has_metadata = True
+                    already_scraped = str(match_id) in existing_balls
+                    has_metadata = str(match_id) in existing_meta
                     if already_scraped:
-                        print(f"    Already scraped, skipping")
-                        scraped_match_ids.append(match_id)  # Already has ball-by-ball
+                        print(f"\n  Match {match_id}: already scraped, skipping")
+                        with stats["lock"]:
+                            stats["scraped_ids"].append(match_id)  # Already has ball-by-ball
                         continue
                     if has_metadata and args.skip_metadata_only:
-                        print(f"    Metadata only (no balls), skipping")
+                        print(f"\n  Match {match_id}: metadata only (no balls), skipping")
                         continue
 
-                match_url = f"https://www.espncricinfo.com/series/{match['series_slug']}/{match['slug']}-{match_id}"
-
-                try:
-                    t0 = time.time()
-                    result = scrape_match_commentary(
-                        browser, context, page, match_url, max_innings=max_innings
-                    )
-                    elapsed = time.time() - t0
-
-                    # Use detected format/gender, fall back to CSV values
-                    save_fmt = result.get("detected_format") or fmt
-                    save_gender = result.get("detected_gender") or gender
-                    if not save_gender:
-                        save_gender = "male"
-                        print(f"    WARNING: Could not detect gender, defaulting to 'male'")
-                    format_dir = f"{save_fmt}_{save_gender}"
-
-                    if result.get("detected_format") and result["detected_format"] != fmt:
-                        print(f"    (auto-detected format: {result['detected_format']}, CSV said: {fmt})")
-
-                    balls = result["balls"]
-                    match_meta = result.get("match_meta")
-                    innings_data = result.get("innings_data")
-
-                    if balls or match_meta or innings_data:
-                        saved = save_all_tables(
-                            balls, match_meta, innings_data,
-                            match_id, format_dir, output_dir
-                        )
-                        tables_saved = list(saved.keys())
-                        if balls:
-                            rich = sum(
-                                1 for b in balls if b.get("wagonX") is not None
-                            )
-                            label = "hawkeye" if result["has_hawkeye"] else "basic"
-                            print(
-                                f"    -> Saved {len(balls)} balls ({rich} {label}) + tables {tables_saved} to {format_dir}/ [{elapsed:.0f}s]"
-                            )
-                            total_matches += 1
-                            total_balls += len(balls)
-                            total_rich += rich
-                            scraped_match_ids.append(match_id)
-                        else:
-                            print(
-                                f"    -> Saved metadata only (tables {tables_saved}) to {format_dir}/ [{elapsed:.0f}s]"
-                            )
-                    elif result.get("scorecard"):
-                        sc = result["scorecard"]
-                        print(
-                            f"    -> Scorecard only: {sc.get('title', 'unknown')} [{elapsed:.0f}s]"
-                        )
-                    else:
-                        print(f"    No data found [{elapsed:.0f}s]")
-
-                    # Log any innings failures to CSV
-                    for fail in result.get("innings_failures", []):
-                        log_scrape_error(
-                            output_dir,
-                            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
-                            match_id=match_id,
-                            series_id=series_id,
-                            series_name=series_info.get("name", ""),
-                            format=result.get("detected_format") or fmt,
-                            teams=teams,
-                            innings_expected=result.get("innings_expected", ""),
-                            innings_scraped=result.get("innings_scraped", ""),
-                            failed_innings=fail["innings"],
-                            error_type=fail["error_type"],
-                            error_message=fail["error_message"][:200],
-                        )
-                except Exception as e:
-                    print(f"    ERROR: {e}")
-                    log_scrape_error(
-                        output_dir,
-                        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
-                        match_id=match_id,
-                        series_id=series_id,
-                        series_name=series_info.get("name", ""),
-                        format=fmt,
-                        teams=teams,
-                        error_type="match_error",
-                        error_message=str(e)[:200],
-                    )
-
-                time.sleep(1)
-
+                # Only matches that will be scraped pay for the header string
+                print(f"\n  Match {match_id}: {' vs '.join(match['teams'][:2])}")
+                queued_ids.add(match_id)
+
+                task = {
+                    "match": match,
+                    "series_info": series_info,
+                    "fmt": fmt,
+                    "gender": gender,
+                    "max_innings": max_innings,
+                    "output_dir": output_dir,
+                    "fetch_html": args.fetch_html,
+                }
+                if tasks is not None:
+                    tasks.put(dict(task, tag=f"[{match_id}] "))
+                else:
+                    page = _scrape_one_match(browser, context, page, stats=stats, **task)
+
+        if workers:
+            _wait_for_tasks(tasks, workers)
+            for _ in workers:
+                tasks.put(None)
+            for w in workers:
+                w.join()
+        _retry_contexts.pop(browser, None)
         _cleanup_browser()
 
-    # Mark scraped matches in fixtures + print summary
-    if scraped_match_ids:
-        mark_fixtures_scraped(output_dir, scraped_match_ids, fixtures_file=fixtures_file)
-    if all_fixtures:
-        fixture_upcoming = sum(1 for f in all_fixtures if f["status"] not in ("FINISHED", "POST"))
+    # Wait for queued parquet writes; they fill stats["scraped_ids"]
+    _write_pool.shutdown(wait=True)
+
+    # Mark scraped matches in fixtures (also folds in this run's deltas) + print summary
+    if stats["scraped_ids"]:
+        mark_fixtures_scraped(output_dir, stats["scraped_ids"], fixtures_file=fixtures_file)
+    else:
+        compact_fixtures(output_dir, fixtures_file=fixtures_file)
+    if fixture_total:
         fx_path = fixtures_file or f"{output_dir}/fixtures.parquet"
-        print(f"\nFixtures: {len(all_fixtures)} total ({fixture_upcoming} upcoming) saved incrementally to {fx_path}")
+        print(f"\nFixtures: {fixture_total} total ({fixture_upcoming} upcoming) saved incrementally to {fx_path}")
 
     print(f"\n{'='*60}")
-    print(f"DONE: {total_matches} matches, {total_balls} balls, {total_rich} rich")
+    print(f"DONE: {stats['matches']} matches, {stats['balls']} balls, {stats['rich']} rich")
     print(f"{'='*60}")
 
 
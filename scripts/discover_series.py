@@ -21,6 +21,9 @@ Usage:
   # Schedule pages only (testing):
   python scripts/discover_series.py --system-chrome --schedule-only --dry-run
 
+  # Reuse a browser kept running by start_browser.py (skips the launch):
+  python scripts/discover_series.py --cdp-endpoint http://localhost:9222 --dry-run
+
   # CI (Playwright's bundled Chromium under Xvfb):
   xvfb-run --auto-servernum python scripts/discover_series.py --update --scan-parquets --cricinfo-dir cricinfo
 """
@@ -30,7 +33,10 @@ import io
 import os
 import time
 import json
+import logging
+import re
 import argparse
+import shutil
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -41,22 +47,46 @@ sys.stderr = io.TextIOWrapper(
     sys.stderr.buffer, encoding="utf-8", errors="replace", line_buffering=True
 )
 
-from playwright.sync_api import sync_playwright
-from playwright_stealth import Stealth
-
 from series_cache import (
     load_csv_cache, scan_parquets_for_series, merge_series, write_csv_cache,
-    CSV_FIELDS, MAX_INNINGS,
+    CSV_FIELDS, MAX_INNINGS, SCAN_WORKERS,
 )
 
+# Per-page discovery diagnostics. Silent unless the caller configures
+# logging; main() routes it to stdout/stderr (--log-level).
+_log = logging.getLogger("discover_series")
+_log.addHandler(logging.NullHandler())
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional: stdlib json is a drop-in fallback
+    _json_loads = json.loads
+
 # ============================================================
 # Configuration — portable defaults relative to script location
 # ============================================================
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_SERIES_LIST = SCRIPT_DIR / "series_list.csv"
 DEFAULT_CRICINFO_DIR = SCRIPT_DIR.parent / "cricinfo"
+# Persistent Chromium profile: cookies (Akamai) and HTTP cache survive between runs
+DEFAULT_PROFILE_DIR = SCRIPT_DIR / ".pw-profile"
 
-stealth = Stealth()
+_stealth = None
+
+
+def _load_browser():
+    """Import Playwright and stealth on first use; returns (sync_playwright, stealth).
+
+    Kept out of module import so --skip-web runs (parquet/CSV only) never pay
+    for loading them.
+    """
+    global _stealth
+    from playwright.sync_api import sync_playwright
+    if _stealth is None:
+        from playwright_stealth import Stealth
+        _stealth = Stealth()
+    return sync_playwright, _stealth
 
 # internationalClassId → format string (same mapping as main scraper)
 FORMAT_FROM_CLASS_ID = {1: "test", 2: "odi", 3: "t20i"}
@@ -78,22 +108,102 @@ SCHEDULE_URLS = [
 # Helpers
 # ============================================================
 
-def extract_next_data(page):
-    """Extract and parse __NEXT_DATA__ from the current page."""
-    nd_text = page.evaluate("""
-        () => {
-            const el = document.getElementById('__NEXT_DATA__');
-            return el ? el.textContent : null;
+# How long extract_next_data waits for the SSR script tag to appear
+NEXT_DATA_TIMEOUT_MS = 2000
+
+# Parses __NEXT_DATA__ in the page and hands back only the subtrees discovery
+# reads (content.matches, content.collections[].matches, keySeriesItems,
+# trendingMatches), each match/item cut down to the fields that
+# _extract_series_from_matches, _extract_key_series and detect_* use. Same
+# paths as the full payload, so callers index it the same way.
+_NEXT_DATA_SUBSET_JS = """
+(el) => {
+    const KEYS = ['objectId', 'id', 'type', 'title', 'longName', 'name', 'slug',
+                  'season', 'format', 'internationalClassId', 'gender'];
+    const pick = (obj) => {
+        const out = {};
+        for (const k of KEYS) if (obj[k] !== undefined) out[k] = obj[k];
+        if (obj.series && typeof obj.series === 'object') out.series = pick(obj.series);
+        return out;
+    };
+    const slimList = (list) => Array.isArray(list)
+        ? list.filter((m) => m && typeof m === 'object').map(pick) : list;
+
+    const props = JSON.parse(el.textContent).props || {};
+    const content = props.appPageProps?.data?.content;
+    let slimContent = content;
+    if (content && typeof content === 'object' && !Array.isArray(content)) {
+        slimContent = {};
+        if ('matches' in content) slimContent.matches = slimList(content.matches);
+        if (Array.isArray(content.collections)) {
+            slimContent.collections = content.collections.map((c) => ({
+                matches: slimList((c && c.matches) || []),
+            }));
         }
-    """)
-    if not nd_text:
-        return None
+    }
+    const edition = props.editionDetails || {};
+    const slimEdition = {};
+    if (Array.isArray(edition.keySeriesItems)) {
+        slimEdition.keySeriesItems = slimList(edition.keySeriesItems);
+    }
+    if (edition.trendingMatches && typeof edition.trendingMatches === 'object') {
+        slimEdition.trendingMatches = {
+            matches: slimList(edition.trendingMatches.matches || []),
+        };
+    }
+    return {
+        props: {
+            appPageProps: { data: { content: slimContent } },
+            editionDetails: slimEdition,
+        },
+    };
+}
+"""
+
+
+def extract_next_data(page):
+    """Extract __NEXT_DATA__ from the current page, trimmed to what discovery uses.
+
+    The payload is parsed and pruned inside the page (_NEXT_DATA_SUBSET_JS),
+    so only the match/series fields discovery reads cross into Python rather
+    than the whole multi-hundred-KB SSR blob. Returns None if the tag never
+    appears or does not parse.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
     try:
-        return json.loads(nd_text)
-    except json.JSONDecodeError:
+        # Locator evaluate waits briefly for the tag on a page still parsing
+        return page.locator("#__NEXT_DATA__").evaluate(
+            _NEXT_DATA_SUBSET_JS, timeout=NEXT_DATA_TIMEOUT_MS
+        )
+    except PlaywrightTimeoutError:
+        return None
+    except Exception as e:  # JSON.parse failure surfaces as a page error
+        _log.warning(f"    Warning: could not parse __NEXT_DATA__: {e}")
         return None
 
 
+def _nd_content_list(nd, key):
+    """props.appPageProps.data.content[key] from extract_next_data, or [].
+
+    One lookup chain: a missing level (KeyError) or a non-dict content
+    (TypeError) short-circuits straight to the empty default.
+    """
+    try:
+        return nd["props"]["appPageProps"]["data"]["content"][key] or []
+    except (KeyError, TypeError):
+        return []
+
+
+# Series-name keywords per format, checked in this order (plain substrings,
+# case-insensitive, so e.g. "50" also matches "50-over")
+_FORMAT_NAME_RES = (
+    ("t20i", re.compile(r"T20|IPL|BBL|CPL", re.IGNORECASE)),
+    ("odi", re.compile(r"ODI|ONE[- ]DAY|50", re.IGNORECASE)),
+    ("test", re.compile(r"TEST|SHEFFIELD|RANJI|TROPHY", re.IGNORECASE)),
+)
+
+
 def detect_format(obj):
     """Detect cricket format from a match or series object.
     Returns 't20i', 'odi', 'test', or None."""
@@ -106,17 +216,17 @@ def detect_format(obj):
         return FORMAT_NORMALIZE[fmt_str.upper()]
 
     name = obj.get("longName", "") or obj.get("name", "") or obj.get("title", "") or ""
-    name_upper = name.upper()
-    if "T20" in name_upper or "IPL" in name_upper or "BBL" in name_upper or "CPL" in name_upper:
-        return "t20i"
-    if "ODI" in name_upper or "ONE-DAY" in name_upper or "ONE DAY" in name_upper or "50" in name_upper:
-        return "odi"
-    if "TEST" in name_upper or "SHEFFIELD" in name_upper or "RANJI" in name_upper or "TROPHY" in name_upper:
-        return "test"
+    for fmt, pattern in _FORMAT_NAME_RES:
+        if pattern.search(name):
+            return fmt
 
     return None
 
 
+# Women's-cricket keywords in series/match names, matched in one pass
+_FEMALE_RE = re.compile(r"women|female|wbbl|wpl|wodi|wt20", re.IGNORECASE)
+
+
 def detect_gender(obj):
     """Detect gender from a match or series object. Returns 'male' or 'female'."""
     gender = obj.get("gender", "")
@@ -126,28 +236,32 @@ def detect_gender(obj):
             return g
 
     name = obj.get("longName", "") or obj.get("name", "") or obj.get("slug", "") or obj.get("title", "") or ""
-    name_lower = name.lower()
-    if any(kw in name_lower for kw in ("women", "female", "wbbl", "wpl", "wodi", "wt20")):
+    if _FEMALE_RE.search(name):
         return "female"
 
     return "male"
 
 
+# MAX_INNINGS pre-stringified for CSV entries
+_MAX_INNINGS_STR = {fmt: str(n) for fmt, n in MAX_INNINGS.items()}
+
+
 def build_series_entry(series_id, name, slug, fmt, gender, season=None):
     """Build a CSV-compatible series entry dict."""
+    sid = series_id if isinstance(series_id, str) else str(series_id)
     if slug:
-        url = f"https://www.espncricinfo.com/series/{slug}-{series_id}"
+        url = f"https://www.espncricinfo.com/series/{slug}-{sid}"
     else:
-        url = f"https://www.espncricinfo.com/series/{series_id}"
+        url = f"https://www.espncricinfo.com/series/{sid}"
 
     return {
-        "series_id": str(series_id),
-        "name": name or f"Series {series_id}",
+        "series_id": sid,
+        "name": name or f"Series {sid}",
         "url": url,
         "season": unquote(season) if season else "",
-        "format": fmt or "test",
-        "max_innings": str(MAX_INNINGS.get(fmt, 4)),
-        "gender": gender or "male",
+        "format": sys.intern(fmt or "test"),
+        "max_innings": _MAX_INNINGS_STR.get(fmt, "4"),
+        "gender": sys.intern(gender or "male"),
     }
 
 
@@ -163,9 +277,16 @@ def _add_series(dest, series_id, entry):
 # Data extraction from match/series objects
 # ============================================================
 
-def _extract_series_from_matches(matches):
-    """Extract unique series from a list of match objects."""
-    seen = {}
+def _extract_series_from_matches(matches, seen=None):
+    """Extract unique series from a list of match objects.
+
+    Pass a shared seen dict (series_id -> entry) to dedupe across calls: ids
+    already in it are skipped, new entries are added to it, and only the new
+    entries are returned.
+    """
+    if seen is None:
+        seen = {}
+    new = []
     for m in matches:
         series = m.get("series") or {}
         series_id = series.get("objectId") or series.get("id")
@@ -182,9 +303,11 @@ def _extract_series_from_matches(matches):
         gender = detect_gender(m) if m.get("gender") else detect_gender(series)
         season = series.get("season") or m.get("season") or ""
 
-        seen[series_id] = build_series_entry(series_id, name, slug, fmt, gender, season)
+        entry = build_series_entry(series_id, name, slug, fmt, gender, season)
+        seen[series_id] = entry
+        new.append(entry)
 
-    return list(seen.values())
+    return new
 
 
 def _extract_key_series(edition_details):
@@ -207,59 +330,76 @@ def _extract_key_series(edition_details):
     return result
 
 
-def _extract_trending_series(edition_details):
+def _extract_trending_series(edition_details, seen=None):
     """Extract series from editionDetails.trendingMatches."""
     trending = edition_details.get("trendingMatches", {}).get("matches", [])
-    return _extract_series_from_matches(trending)
+    return _extract_series_from_matches(trending, seen)
 
 
 # ============================================================
 # Tier 2: Live scores page (SSR — existing logic)
 # ============================================================
 
-def discover_from_live_scores(page):
+def start_navigation(page, url):
+    """Begin loading url and return once the response has committed.
+
+    The rest of the load carries on in the browser, so several pages started
+    back to back download and render concurrently; the discover_* functions
+    then wait for each one. Returns False if the navigation failed.
+    """
+    try:
+        page.goto(url, wait_until="commit", timeout=30000)
+        return True
+    except Exception as e:
+        _log.warning(f"    Error starting navigation to {url}: {e}")
+        return False
+
+
+def discover_from_live_scores(page, started=False, seen=None):
     """Discover series from /live-cricket-score page.
 
     This page has content.matches in __NEXT_DATA__ (SSR), unlike schedule pages
-    which load matches client-side via API.
+    which load matches client-side via API. Pass started=True if
+    start_navigation() has already begun loading the page; otherwise (or if
+    that failed) it is loaded here. Series from matches are recorded in the
+    shared seen dict (see _extract_series_from_matches); key series are
+    returned for the caller to add.
     """
     try:
-        print(f"  Navigating to {LIVE_SCORES_URL}")
-        page.goto(LIVE_SCORES_URL, wait_until="domcontentloaded", timeout=30000)
+        _log.info(f"  Navigating to {LIVE_SCORES_URL}")
+        if started:
+            page.wait_for_load_state("domcontentloaded", timeout=30000)
+        else:
+            page.goto(LIVE_SCORES_URL, wait_until="domcontentloaded", timeout=30000)
         time.sleep(2)
 
         title = page.title()
         if "access denied" in title.lower():
-            print(f"    Blocked by Akamai")
+            _log.warning("    Blocked by Akamai")
             return [], []
 
         nd = extract_next_data(page)
         if not nd:
-            print(f"    No __NEXT_DATA__ found")
+            _log.info("    No __NEXT_DATA__ found")
             return [], []
 
-        props = nd.get("props", {})
-        app_data = props.get("appPageProps", {}).get("data", {})
-        edition = props.get("editionDetails", {})
+        edition = nd["props"]["editionDetails"]
 
-        content = app_data.get("content", {})
-        matches = content.get("matches", []) if isinstance(content, dict) else []
-        match_series = _extract_series_from_matches(matches) if matches else []
-        print(f"    content.matches: {len(matches)} matches -> {len(match_series)} series")
+        matches = _nd_content_list(nd, "matches")
+        match_series = _extract_series_from_matches(matches, seen) if matches else []
+        _log.info(f"    content.matches: {len(matches)} matches -> {len(match_series)} series")
 
         key_series = _extract_key_series(edition)
-        print(f"    keySeriesItems: {len(key_series)} series")
+        _log.info(f"    keySeriesItems: {len(key_series)} series")
 
-        trending_series = _extract_trending_series(edition)
-        print(f"    trendingMatches: {len(trending_series)} series")
+        trending_series = _extract_trending_series(edition, seen)
+        _log.info(f"    trendingMatches: {len(trending_series)} series")
 
         all_from_matches = match_series + trending_series
         return all_from_matches, key_series
 
     except Exception as e:
-        import traceback
-        print(f"    Error in live scores discovery: {e}", file=sys.stderr)
-        traceback.print_exc(file=sys.stderr)
+        _log.warning(f"    Error in live scores discovery: {e}", exc_info=True)
         return [], []
 
 
@@ -267,16 +407,20 @@ def discover_from_live_scores(page):
 # Tier 3: Schedule pages (API interception)
 # ============================================================
 
-def discover_from_schedule_pages(page):
-    """Discover series from /cricket/schedule/* pages.
+# Schedule pages: max wait for the first API response after load, how long
+# the API must stay quiet before scrolling stops, poll interval, and a cap
+# on total scrolling
+SCHEDULE_FIRST_RESPONSE_S = 3.0
+SCHEDULE_QUIET_S = 2.0
+SCHEDULE_POLL_MS = 300
+SCHEDULE_SCROLL_MAX_S = 20.0
 
-    These pages load match data client-side via hs-consumer-api. We intercept
-    the API responses to extract series metadata. Falls back to __NEXT_DATA__
-    if interception fails.
-    """
-    all_series = []
-    intercepted_matches = []
 
+def _schedule_response_handler(intercepted_matches, activity):
+    """Response listener that collects match objects from schedule API calls.
+
+    Stamps activity["last"] with the time of each schedule API response.
+    """
     def on_response(response):
         """Capture schedule API responses."""
         url = response.url
@@ -285,78 +429,114 @@ def discover_from_schedule_pages(page):
         # Schedule API endpoints contain /schedule or /matches
         if "/schedule" not in url and "/matches" not in url:
             return
+        activity["last"] = time.monotonic()
         try:
-            body = response.json()
+            body = _json_loads(response.body())
             # The API returns match collections — extract matches from various shapes
             matches = _extract_matches_from_api(body)
             intercepted_matches.extend(matches)
         except Exception as exc:
-            print(f"    Warning: Failed to parse schedule API response: {exc}", file=sys.stderr)
+            _log.warning(f"    Warning: Failed to parse schedule API response: {exc}")
+    return on_response
 
+
+def start_schedule_pages(context):
+    """Open one tab per SCHEDULE_URLS entry and start all of them loading.
+
+    The API listener goes on before navigation so no early response is missed.
+    Returns a list of (schedule_url, page, intercepted_matches, activity,
+    listener, started) for discover_from_schedule_pages().
+    """
+    loads = []
     for schedule_url in SCHEDULE_URLS:
-        try:
-            page_label = "upcoming" if "upcoming" in schedule_url else "past-results"
-            print(f"  Navigating to schedule/{page_label}")
+        page = context.new_page()
+        intercepted_matches = []
+        activity = {"last": time.monotonic()}
+        on_response = _schedule_response_handler(intercepted_matches, activity)
+        page.on("response", on_response)
+        started = start_navigation(page, schedule_url)
+        loads.append((schedule_url, page, intercepted_matches, activity, on_response, started))
+    return loads
 
-            intercepted_matches.clear()
-            page.on("response", on_response)
 
-            page.goto(schedule_url, wait_until="domcontentloaded", timeout=30000)
-            time.sleep(3)  # Wait for client-side API calls
+def discover_from_schedule_pages(loads, seen=None):
+    """Discover series from /cricket/schedule/* pages.
+
+    These pages load match data client-side via hs-consumer-api. We intercept
+    the API responses to extract series metadata. Falls back to __NEXT_DATA__
+    if interception fails. loads comes from start_schedule_pages(), so every
+    page is already downloading by the time the first one is processed. With
+    a shared seen dict, series already found elsewhere are skipped outright.
+    """
+    all_series = []
+
+    for schedule_url, page, intercepted_matches, activity, on_response, started in loads:
+        page_label = "upcoming" if "upcoming" in schedule_url else "past-results"
+        try:
+            _log.info(f"  Navigating to schedule/{page_label}")
+            if started:
+                page.wait_for_load_state("domcontentloaded", timeout=30000)
+            else:
+                # Early start failed: one ordinary attempt, as before
+                page.goto(schedule_url, wait_until="domcontentloaded", timeout=30000)
+            # Wait for the first client-side API call (wait_for_timeout, unlike
+            # time.sleep, lets Playwright deliver response events meanwhile)
+            deadline = time.monotonic() + SCHEDULE_FIRST_RESPONSE_S
+            while not intercepted_matches and time.monotonic() < deadline:
+                page.wait_for_timeout(SCHEDULE_POLL_MS)
 
             title = page.title()
             if "access denied" in title.lower():
-                print(f"    Blocked by Akamai")
+                _log.warning("    Blocked by Akamai")
                 page.remove_listener("response", on_response)
                 continue
 
-            # Scroll down to trigger lazy-loaded content (adaptive like main scraper)
-            prev_match_count = len(intercepted_matches)
-            for scroll_i in range(20):
+            # Scroll down to trigger lazy-loaded content until the schedule
+            # API has been quiet for SCHEDULE_QUIET_S
+            scroll_start = activity["last"] = time.monotonic()
+            while True:
                 page.keyboard.press("End")
-                time.sleep(1)
-                if len(intercepted_matches) > prev_match_count:
-                    prev_match_count = len(intercepted_matches)
-                elif scroll_i >= 2:
-                    break  # No new data after at least 3 scrolls
+                page.wait_for_timeout(SCHEDULE_POLL_MS)
+                now = time.monotonic()
+                if now - activity["last"] > SCHEDULE_QUIET_S:
+                    break
+                if now - scroll_start > SCHEDULE_SCROLL_MAX_S:
+                    break
 
             page.remove_listener("response", on_response)
 
             # Extract series from intercepted API responses
             if intercepted_matches:
-                api_series = _extract_series_from_matches(intercepted_matches)
-                print(f"    API interception: {len(intercepted_matches)} matches -> {len(api_series)} series")
+                api_series = _extract_series_from_matches(intercepted_matches, seen)
+                _log.info(f"    API interception: {len(intercepted_matches)} matches -> {len(api_series)} series")
                 all_series.extend(api_series)
             else:
                 # Fallback: try __NEXT_DATA__
                 nd = extract_next_data(page)
                 if nd:
-                    props = nd.get("props", {})
-                    app_data = props.get("appPageProps", {}).get("data", {})
-                    content = app_data.get("content", {})
-                    matches = content.get("matches", []) if isinstance(content, dict) else []
+                    matches = _nd_content_list(nd, "matches")
                     if matches:
-                        nd_series = _extract_series_from_matches(matches)
-                        print(f"    __NEXT_DATA__ fallback: {len(matches)} matches -> {len(nd_series)} series")
+                        nd_series = _extract_series_from_matches(matches, seen)
+                        _log.info(f"    __NEXT_DATA__ fallback: {len(matches)} matches -> {len(nd_series)} series")
                         all_series.extend(nd_series)
                     else:
                         # Try collections (schedule pages sometimes use this structure)
-                        collections = content.get("collections", []) if isinstance(content, dict) else []
+                        collections = _nd_content_list(nd, "collections")
                         for coll in collections:
                             coll_matches = coll.get("matches", [])
                             if coll_matches:
-                                coll_series = _extract_series_from_matches(coll_matches)
+                                coll_series = _extract_series_from_matches(coll_matches, seen)
                                 all_series.extend(coll_series)
                         if collections:
                             total = sum(len(c.get("matches", [])) for c in collections)
-                            print(f"    __NEXT_DATA__ collections: {total} matches -> {len(all_series)} series")
+                            _log.info(f"    __NEXT_DATA__ collections: {total} matches -> {len(all_series)} series")
                         else:
-                            print(f"    No data found on {page_label} page")
+                            _log.info(f"    No data found on {page_label} page")
                 else:
-                    print(f"    No __NEXT_DATA__ on {page_label} page")
+                    _log.info(f"    No __NEXT_DATA__ on {page_label} page")
 
         except Exception as e:
-            print(f"    Error on {page_label}: {e}")
+            _log.warning(f"    Error on {page_label}: {e}")
             try:
                 page.remove_listener("response", on_response)
             except Exception:
@@ -366,39 +546,36 @@ def discover_from_schedule_pages(page):
 
 
 def _extract_matches_from_api(body):
-    """Extract match objects from various API response shapes."""
-    matches = []
+    """Extract match objects from various API response shapes.
+
+    Real responses use one shape, so the first shape holding any matches wins;
+    an empty list falls through to the next shape.
+    """
+    # Shape 4: top-level array
+    if isinstance(body, list):
+        return [item for item in body if isinstance(item, dict) and "series" in item]
+    if not isinstance(body, dict):
+        return []
 
     # Shape 1: { matches: [...] }
-    if isinstance(body, dict) and "matches" in body:
-        raw = body["matches"]
-        if isinstance(raw, list):
-            matches.extend(raw)
+    raw = body.get("matches")
+    if isinstance(raw, list) and raw:
+        return raw
 
     # Shape 2: { content: { matches: [...] } }
-    if isinstance(body, dict) and "content" in body:
-        content = body["content"]
-        if isinstance(content, dict) and "matches" in content:
-            raw = content["matches"]
-            if isinstance(raw, list):
-                matches.extend(raw)
+    content = body.get("content")
+    raw = content.get("matches") if isinstance(content, dict) else None
+    if isinstance(raw, list) and raw:
+        return raw
 
     # Shape 3: { collections: [{ matches: [...] }, ...] }
-    if isinstance(body, dict):
-        collections = body.get("collections", [])
-        if isinstance(collections, list):
-            for coll in collections:
-                if isinstance(coll, dict) and "matches" in coll:
-                    raw = coll["matches"]
-                    if isinstance(raw, list):
-                        matches.extend(raw)
-
-    # Shape 4: top-level array
-    if isinstance(body, list):
-        for item in body:
-            if isinstance(item, dict) and "series" in item:
-                matches.append(item)
-
+    matches = []
+    collections = body.get("collections")
+    if isinstance(collections, list):
+        for coll in collections:
+            raw = coll.get("matches") if isinstance(coll, dict) else None
+            if isinstance(raw, list):
+                matches.extend(raw)
     return matches
 
 
@@ -406,6 +583,33 @@ def _extract_matches_from_api(body):
 # Main
 # ============================================================
 
+def launch_options(system_chrome=False):
+    """Chromium launch options shared by discovery and start_browser.py."""
+    opts = {
+        "headless": False,
+        "args": ["--disable-blink-features=AutomationControlled"],
+        "viewport": {"width": 1280, "height": 900},
+        "locale": "en-US",
+    }
+    if system_chrome:
+        opts["channel"] = "chrome"
+    return opts
+
+
+def _configure_logging(level):
+    """Send discovery log records to stdout (below WARNING) and stderr, message only."""
+    fmt = logging.Formatter("%(message)s")
+    out = logging.StreamHandler(sys.stdout)
+    out.setFormatter(fmt)
+    out.addFilter(lambda record: record.levelno < logging.WARNING)
+    err = logging.StreamHandler(sys.stderr)
+    err.setFormatter(fmt)
+    err.setLevel(logging.WARNING)
+    _log.addHandler(out)
+    _log.addHandler(err)
+    _log.setLevel(level)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Discover new ESPN Cricinfo series not yet in series_list.csv"
@@ -448,6 +652,12 @@ def main():
         default=os.environ.get("CRICINFO_OUTPUT_DIR", str(DEFAULT_CRICINFO_DIR)),
         help="Path to cricinfo/ data directory (for parquet scanning)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=SCAN_WORKERS,
+        help=f"Threads reading _match.parquet files in Tier 1 (default: {SCAN_WORKERS})",
+    )
     # Tier 3: Schedule pages
     parser.add_argument(
         "--skip-schedule",
@@ -465,7 +675,32 @@ def main():
         action="store_true",
         help="Skip all web scraping (Tier 2 + Tier 3), only use parquets + CSV",
     )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=os.environ.get("CRICINFO_PROFILE_DIR", str(DEFAULT_PROFILE_DIR)),
+        help="Browser profile directory reused across runs (cookies + cache)",
+    )
+    parser.add_argument(
+        "--cdp-endpoint",
+        type=str,
+        default=os.environ.get("CRICINFO_CDP"),
+        help="Connect to a running browser (see start_browser.py) instead of "
+             "launching one, e.g. http://localhost:9222",
+    )
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="Delete the browser profile before launching",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Verbosity of per-page discovery diagnostics (default: INFO)",
+    )
     args = parser.parse_args()
+    _configure_logging(args.log_level)
 
     csv_path = Path(args.series_list)
 
@@ -480,7 +715,7 @@ def main():
         print(f"\n{'='*60}")
         print("Tier 1: Scanning parquet files for series metadata")
         print(f"{'='*60}")
-        parquet_series = scan_parquets_for_series(args.cricinfo_dir)
+        parquet_series = scan_parquets_for_series(args.cricinfo_dir, workers=args.jobs)
         new_from_parquets = len(set(parquet_series.keys()) - existing_ids)
         print(f"  Found {len(parquet_series)} series in parquets ({new_from_parquets} new)")
 
@@ -488,30 +723,44 @@ def main():
     web_discovered = {}  # series_id → entry dict
 
     if not args.skip_web:
-        launch_opts = {
-            "headless": False,
-            "args": ["--disable-blink-features=AutomationControlled"],
-        }
-        if args.system_chrome:
-            launch_opts["channel"] = "chrome"
+        profile_dir = Path(args.profile_dir)
+        if args.fresh_profile and not args.cdp_endpoint:
+            shutil.rmtree(profile_dir, ignore_errors=True)
 
+        sync_playwright, stealth = _load_browser()
         with sync_playwright() as p:
-            browser = p.chromium.launch(**launch_opts)
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 900},
-                locale="en-US",
-            )
+            if args.cdp_endpoint:
+                # Already-running browser (start_browser.py): no launch cost,
+                # and its cookies/cache are as warm as they get
+                browser = p.chromium.connect_over_cdp(args.cdp_endpoint)
+                context = browser.contexts[0] if browser.contexts else browser.new_context()
+                _log.info(f"Connected to running browser at {args.cdp_endpoint}")
+            else:
+                # Warm profile: a repeat run keeps its Akamai cookies and cached assets
+                context = p.chromium.launch_persistent_context(
+                    str(profile_dir), **launch_options(args.system_chrome)
+                )
             stealth.apply_stealth_sync(context)
-            page = context.new_page()
+            preexisting_pages = set(context.pages)
+
+            # Start every page we need loading before processing any of them,
+            # so the slowest load, not the sum of loads, sets the wait
+            run_live = not args.schedule_only
+            if run_live:
+                live_page = context.new_page()
+                live_started = start_navigation(live_page, LIVE_SCORES_URL)
+            if not args.skip_schedule:
+                schedule_loads = start_schedule_pages(context)
 
             # Tier 2: Live scores (SSR)
-            if not args.schedule_only:
+            if run_live:
                 print(f"\n{'='*60}")
                 print("Tier 2: Discovering series from live scores page")
                 print(f"{'='*60}")
-                match_series, key_series = discover_from_live_scores(page)
-                for s in match_series:
-                    _add_series(web_discovered, s["series_id"], s)
+                # Match-derived series land in web_discovered directly
+                _, key_series = discover_from_live_scores(
+                    live_page, started=live_started, seen=web_discovered
+                )
                 for s in key_series:
                     _add_series(web_discovered, s["series_id"], s)
 
@@ -520,22 +769,27 @@ def main():
                 print(f"\n{'='*60}")
                 print("Tier 3: Discovering series from schedule pages")
                 print(f"{'='*60}")
-                schedule_series = discover_from_schedule_pages(page)
-                for s in schedule_series:
-                    _add_series(web_discovered, s["series_id"], s)
+                discover_from_schedule_pages(schedule_loads, seen=web_discovered)
 
-            browser.close()
+            if args.cdp_endpoint:
+                # Leave the shared browser running; just drop our own tabs
+                for page in context.pages:
+                    if page not in preexisting_pages:
+                        page.close()
+            else:
+                context.close()
 
     # ── Merge all sources ──
     merged = merge_series(csv_cache, parquet_series, web_discovered)
 
-    # Apply season override to newly discovered entries
+    # New ids by set difference; only those get sorted (newest first)
+    # and the season override
     new_series = {}
-    for sid, entry in merged.items():
-        if sid not in existing_ids:
-            if args.season:
-                entry["season"] = args.season
-            new_series[sid] = entry
+    for sid in sorted(merged.keys() - existing_ids, key=int, reverse=True):
+        entry = merged[sid]
+        if args.season:
+            entry["season"] = args.season
+        new_series[sid] = entry
 
     # ── Report ──
     print(f"\n{'='*60}")
@@ -549,9 +803,11 @@ def main():
 
     if new_series:
         print(f"\nNew series to add:")
-        for sid in sorted(new_series.keys(), key=lambda x: int(x), reverse=True):
-            s = new_series[sid]
-            print(f"  {s['series_id']:>10}  {s['format']:<5}  {s.get('gender', 'male'):<7}  {s['name']}")
+        # One write (one line-buffered flush) for the whole listing
+        print("\n".join(
+            f"  {s['series_id']:>10}  {s['format']:<5}  {s.get('gender', 'male'):<7}  {s['name']}"
+            for s in new_series.values()
+        ))
 
         if args.update and not args.dry_run:
             write_csv_cache(merged, csv_path)
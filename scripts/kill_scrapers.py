@@ -8,6 +8,27 @@ import os
 from pathlib import Path
 
 
+def _kill_pids(pids):
+    """Force-kill the given PIDs (and, on Windows, their child trees).
+
+    On Windows a single taskkill call takes every /PID, so N processes cost one
+    subprocess launch rather than N.
+    """
+    if not pids:
+        return
+    if sys.platform == "win32":
+        args = ["taskkill", "/F", "/T"]
+        for pid in pids:
+            args += ["/PID", str(pid)]
+        subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        for pid in pids:
+            try:
+                os.kill(pid, 9)
+            except ProcessLookupError:
+                pass
+
+
 def main():
     # 1. Find and kill scraper Python processes (by PID files)
     cricinfo_dir = Path(__file__).resolve().parent.parent / "cricinfo"
@@ -22,74 +43,60 @@ def main():
                     continue
                 key, val = line.split("=", 1)
                 if val != "unknown":
-                    pid = int(val)
-                    killed_pids.add(pid)
-                    if sys.platform == "win32":
-                        subprocess.run(
-                            ["taskkill", "/F", "/T", "/PID", str(pid)],
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                        )
-                    else:
-                        try:
-                            os.kill(pid, 9)
-                        except ProcessLookupError:
-                            pass
+                    killed_pids.add(int(val))
         except Exception as e:
             print(f"  Warning: {pf.name}: {e}")
         finally:
             # Always clean up the PID file, even if parsing failed
             pf.unlink(missing_ok=True)
+    _kill_pids(sorted(killed_pids))
 
     if killed_pids:
         print(f"Killed {len(killed_pids)} processes from PID files: {killed_pids}")
     else:
         print("No PID files found.")
 
-    # 2. Fallback: find Python processes running cricinfo_scraper
     if sys.platform == "win32":
+        # One PowerShell/WMI query covers steps 2 and 3 (each startup is ~0.5s):
+        # prints "<name> <pid>" per matching python.exe / chrome.exe
         try:
             result = subprocess.run(
                 ["powershell", "-Command",
-                 "Get-CimInstance Win32_Process -Filter \"Name = 'python.exe'\" "
-                 "| Where-Object { $_.CommandLine -match 'cricinfo_scraper' } "
-                 "| Select-Object -ExpandProperty ProcessId"],
-                capture_output=True, text=True, timeout=10,
+                 "Get-CimInstance Win32_Process "
+                 "-Filter \"Name = 'python.exe' OR Name = 'chrome.exe'\" "
+                 "| Where-Object { ($_.Name -eq 'python.exe' -and $_.CommandLine -match 'cricinfo_scraper') "
+                 "-or ($_.Name -eq 'chrome.exe' -and $_.CommandLine -match 'disable-blink-features') } "
+                 "| ForEach-Object { $_.Name + ' ' + $_.ProcessId }"],
+                capture_output=True, text=True, timeout=15,
             )
-            for line in result.stdout.strip().split("\n"):
-                line = line.strip()
-                if line.isdigit():
-                    pid = int(line)
-                    if pid not in killed_pids and pid != os.getpid():
-                        subprocess.run(
-                            ["taskkill", "/F", "/T", "/PID", str(pid)],
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                        )
-                        print(f"Killed scraper Python process {pid}")
         except Exception as e:
             print(f"  Warning scanning processes: {e}")
+            result = None
 
-    # 3. Kill orphaned Playwright Chrome (identified by --disable-blink-features)
-    if sys.platform == "win32":
-        try:
-            result = subprocess.run(
-                ["powershell", "-Command",
-                 "Get-CimInstance Win32_Process -Filter \"Name = 'chrome.exe'\" "
-                 "| Where-Object { $_.CommandLine -match 'disable-blink-features' } "
-                 "| Select-Object -ExpandProperty ProcessId"],
-                capture_output=True, text=True, timeout=15,
-            )
-            chrome_pids = [int(l.strip()) for l in result.stdout.strip().split("\n") if l.strip().isdigit()]
-            for pid in chrome_pids:
-                subprocess.run(
-                    ["taskkill", "/F", "/T", "/PID", str(pid)],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                )
+        stray_pids = []
+        chrome_pids = []
+        if result is not None:
+            for line in result.stdout.strip().split("\n"):
+                name, _, pid = line.strip().rpartition(" ")
+                if not pid.isdigit():
+                    continue
+                if name.lower() == "chrome.exe":
+                    chrome_pids.append(int(pid))
+                elif int(pid) not in killed_pids and int(pid) != os.getpid():
+                    stray_pids.append(int(pid))
+
+        # 2. Fallback: kill Python processes running cricinfo_scraper
+        _kill_pids(stray_pids)
+        for pid in stray_pids:
+            print(f"Killed scraper Python process {pid}")
+
+        # 3. Kill orphaned Playwright Chrome (identified by --disable-blink-features)
+        if result is not None:
+            _kill_pids(chrome_pids)
             if chrome_pids:
                 print(f"Killed {len(chrome_pids)} Playwright Chrome processes")
             else:
                 print("No orphaned Playwright Chrome processes found")
-        except Exception as e:
-            print(f"  Warning scanning Chrome: {e}")
 
     print("Done.")
 
@@ -19,10 +19,25 @@ Usage:
 """
 
 import csv
+import io
+import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # optional: stdlib json is a drop-in fallback
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # ============================================================
 # CSV field names (gender column is new, backwards-compatible)
 # ============================================================
@@ -30,6 +45,21 @@ CSV_FIELDS = ["series_id", "name", "url", "season", "format", "max_innings", "ge
 
 MAX_INNINGS = {"test": 4, "odi": 2, "t20i": 2}
 
+# Values load_csv_cache uses for columns missing from an older CSV
+_CSV_DEFAULTS = {"format": "test", "max_innings": "4"}
+
+# Whitespace and stray quotes trimmed from each CSV field in one strip() call
+_CSV_STRIP = ' \t\r\n"'
+
+# Low-cardinality CSV columns whose values load_csv_cache interns
+_INTERNED_FIELDS = ("season", "format", "max_innings", "gender")
+
+# Column positions in CSV_FIELDS rows (write_csv_cache builds plain lists)
+_NAME_IDX = CSV_FIELDS.index("name")
+_FORMAT_IDX = CSV_FIELDS.index("format")
+_MAX_INNINGS_IDX = CSV_FIELDS.index("max_innings")
+_GENDER_IDX = CSV_FIELDS.index("gender")
+
 # Format directory prefix → normalized format string
 FORMAT_DIR_MAP = {
     "t20i": "t20i",
@@ -37,108 +67,218 @@ FORMAT_DIR_MAP = {
     "test": "test",
 }
 
+# international_class_id → normalized format string
+_CLASS_ID_MAP = {1: "test", 2: "odi", 3: "t20i"}
+
+# Upper-cased format string variants → normalized format string
+_FORMAT_MAP = {
+    "TEST": "test", "ODI": "odi", "T20I": "t20i", "T20": "t20i",
+    "MDM": "test", "ODM": "odi", "IT20": "t20i",
+}
+
 
 # ============================================================
 # Tier 1: Parquet scan
 # ============================================================
 
-def scan_parquets_for_series(cricinfo_dir):
+# Columns we want from _match.parquet (not all will exist in every file)
+_SCAN_COLUMNS = {"series_id", "series_name", "format", "gender",
+                 "international_class_id", "start_date"}
+
+# Threads reading _match.parquet footers/columns; pyarrow drops the GIL for
+# the file I/O and decode, so threads overlap without process start-up cost
+SCAN_WORKERS = 8
+
+# Sidecar in cricinfo_dir remembering each match file's series entry, keyed by
+# "{format_gender}/{file}" with the file's mtime_ns and size as validators
+SCAN_CACHE_NAME = ".series_scan_cache.json"
+# Cached entries are already derived (format, gender, season). Bump this when
+# _scan_one_match or the helpers it calls change, so old entries are dropped
+SCAN_CACHE_VERSION = 1
+
+
+def scan_parquets_for_series(cricinfo_dir, workers=SCAN_WORKERS):
     """Scan _match.parquet files to discover series metadata.
 
     Reads only the columns needed (series_id, series_name, format, gender,
     international_class_id) using pyarrow column projection — no full file loads.
+    Files are read on `workers` threads; results are merged in file order,
+    so the first file seen for a series still wins. Per-file results are kept
+    in SCAN_CACHE_NAME so unchanged files are not reopened on the next run.
 
     Returns dict keyed by series_id with entry dicts.
     """
-    import pyarrow.parquet as pq
-
     cricinfo_path = Path(cricinfo_dir)
     if not cricinfo_path.exists():
         return {}
 
     series = {}
-    match_files = list(cricinfo_path.glob("*/*_match.parquet"))
+    match_files = list(_iter_match_files(cricinfo_path))
     if not match_files:
         return {}
 
-    # Columns we want from _match.parquet (not all will exist in every file)
-    target_cols = {"series_id", "series_name", "format", "gender",
-                   "international_class_id", "start_date"}
-
-    for mf in match_files:
+    # Reuse cached entries for files unchanged since the last scan
+    cache = _load_scan_cache(cricinfo_path)
+    fresh_cache = {}
+    results = [None] * len(match_files)
+    misses = []
+    for i, (f, dir_name) in enumerate(match_files):
+        key = f"{dir_name}/{f.name}"
         try:
-            # Read only available target columns
-            schema = pq.read_schema(mf)
-            available = [c for c in target_cols if c in schema.names]
-            if "series_id" not in available:
-                continue
-
-            table = pq.read_table(mf, columns=available)
-            for i in range(table.num_rows):
-                sid = str(table.column("series_id")[i].as_py())
-                if not sid or sid == "None":
-                    continue
-                if sid in series:
-                    continue
-
-                name = _col_val(table, "series_name", i) or ""
-                fmt_raw = _col_val(table, "format", i) or ""
-                gender = _col_val(table, "gender", i) or ""
-                class_id = _col_val(table, "international_class_id", i)
-
-                # Detect format from directory name as fallback
-                dir_name = mf.parent.name  # e.g. "t20i_male"
-                dir_fmt = dir_name.split("_")[0] if "_" in dir_name else ""
-                dir_gender = dir_name.split("_")[1] if "_" in dir_name else ""
-
-                fmt = _normalize_format(fmt_raw, class_id) or FORMAT_DIR_MAP.get(dir_fmt)
-                if not gender:
-                    gender = dir_gender or "male"
-                gender = gender.lower()
-
-                # Infer season from start_date if available
-                start_date = _col_val(table, "start_date", i) or ""
-                season = _season_from_date(start_date)
-
-                url = f"https://www.espncricinfo.com/series/{sid}"
-
-                series[sid] = {
-                    "series_id": sid,
-                    "name": name,
-                    "url": url,
-                    "season": season,
-                    "format": fmt or "test",
-                    "max_innings": str(MAX_INNINGS.get(fmt, 4)),
-                    "gender": gender,
-                }
-        except Exception as e:
-            print(f"  Warning: Could not read {mf.name}: {e}", file=sys.stderr)
+            st = f.stat()
+        except OSError:
             continue
+        hit = cache.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            results[i] = hit[2]
+            fresh_cache[key] = hit
+        else:
+            misses.append((i, key, st))
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            scanned = pool.map(
+                _scan_one_match,
+                [match_files[i][0].path for i, _, _ in misses],
+                [match_files[i][1] for i, _, _ in misses],
+            )
+            for (i, key, st), entry in zip(misses, scanned):
+                if entry is False:
+                    continue  # unreadable: retry on the next scan
+                results[i] = entry
+                fresh_cache[key] = [st.st_mtime_ns, st.st_size, entry]
+
+    for entry in results:
+        if entry and entry["series_id"] not in series:
+            series[entry["series_id"]] = entry
+
+    if misses or len(fresh_cache) != len(cache):
+        _save_scan_cache(cricinfo_path, fresh_cache)
 
     return series
 
 
-def _col_val(table, col_name, row_idx):
-    """Safely get a column value from a pyarrow table."""
-    if col_name not in table.column_names:
-        return None
-    val = table.column(col_name)[row_idx].as_py()
-    return val
+def _iter_match_files(root):
+    """Yield (DirEntry, format_gender dir name) for every */*_match.parquet under root."""
+    with os.scandir(root) as subs:
+        for sub in subs:
+            if not sub.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(sub.path) as files:
+                for f in files:
+                    if f.name.endswith("_match.parquet"):
+                        yield f, sub.name
+
 
+def _load_scan_cache(cricinfo_path):
+    """Load the per-file scan cache.
 
+    Returns {} if it is missing, unreadable, or from another SCAN_CACHE_VERSION.
+    """
+    cache_path = Path(cricinfo_path) / SCAN_CACHE_NAME
+    try:
+        cache = _json_loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Ignoring unreadable {cache_path.name}: {e}", file=sys.stderr)
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != SCAN_CACHE_VERSION:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_scan_cache(cricinfo_path, cache):
+    """Write the per-file scan cache atomically (temp file + rename)."""
+    cache_path = Path(cricinfo_path) / SCAN_CACHE_NAME
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(_json_dumps({"version": SCAN_CACHE_VERSION, "files": cache}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  Warning: Could not write {cache_path.name}: {e}", file=sys.stderr)
+
+
+def _scan_one_match(path, dir_name):
+    """Series entry from one _match.parquet.
+
+    Returns None if the file has no series_id, False if it could not be read.
+
+    Every row of a match file carries the same series, so only the first row
+    of the first non-empty row group is decoded.
+    """
+    import pyarrow.parquet as pq
+
+    try:
+        # One open/footer parse; pre_buffer coalesces the column-chunk reads
+        pf = pq.ParquetFile(path, pre_buffer=True)
+        # Read only available target columns
+        names = set(pf.schema_arrow.names)
+        available = [c for c in _SCAN_COLUMNS if c in names]
+        if "series_id" not in names:
+            return None
+        # First row group holding any rows (writers can emit empty ones);
+        # a file with no rows at all is skipped quietly, not as unreadable
+        md = pf.metadata
+        rg = next((i for i in range(md.num_row_groups) if md.row_group(i).num_rows), None)
+        if rg is None:
+            return None
+        # One conversion to Python for the whole row; absent columns read as None
+        row = pf.read_row_group(rg, columns=available).slice(0, 1).to_pylist()[0]
+        sid = str(row["series_id"])
+        if not sid or sid == "None":
+            return None
+
+        name = row.get("series_name") or ""
+        fmt_raw = row.get("format") or ""
+        gender = row.get("gender") or ""
+        class_id = row.get("international_class_id")
+
+        # Detect format from directory name as fallback
+        # dir_name is the format_gender directory, e.g. "t20i_male"
+        dir_fmt = dir_name.split("_")[0] if "_" in dir_name else ""
+        dir_gender = dir_name.split("_")[1] if "_" in dir_name else ""
+
+        fmt = _normalize_format(fmt_raw, class_id) or FORMAT_DIR_MAP.get(dir_fmt)
+        if not gender:
+            gender = dir_gender or "male"
+        gender = gender.lower()
+
+        # Infer season from start_date if available
+        start_date = row.get("start_date") or ""
+        season = _season_from_date(start_date)
+
+        url = f"https://www.espncricinfo.com/series/{sid}"
+
+        return {
+            "series_id": sid,
+            "name": name,
+            "url": url,
+            "season": season,
+            "format": fmt or "test",
+            "max_innings": str(MAX_INNINGS.get(fmt, 4)),
+            "gender": gender,
+        }
+    except Exception as e:
+        print(f"  Warning: Could not read {os.path.basename(path)}: {e}", file=sys.stderr)
+        return False
+
+
+@lru_cache(maxsize=128)
 def _normalize_format(fmt_str, class_id=None):
     """Normalize format strings and class IDs to t20i/odi/test."""
-    CLASS_ID_MAP = {1: "test", 2: "odi", 3: "t20i"}
-    if class_id and class_id in CLASS_ID_MAP:
-        return CLASS_ID_MAP[class_id]
+    if class_id and class_id in _CLASS_ID_MAP:
+        return _CLASS_ID_MAP[class_id]
     if not fmt_str:
         return None
-    fmt_upper = str(fmt_str).upper()
-    FORMAT_MAP = {
-        "TEST": "test", "ODI": "odi", "T20I": "t20i", "T20": "t20i",
-        "MDM": "test", "ODM": "odi", "IT20": "t20i",
-    }
-    return FORMAT_MAP.get(fmt_upper)
+    if not isinstance(fmt_str, str):
+        fmt_str = str(fmt_str)
+    return _FORMAT_MAP.get(fmt_str.upper())
+
+
+# (year, month) -> season string; a few hundred distinct keys at most
+_SEASON_CACHE = {}
 
 
 def _season_from_date(date_str):
@@ -148,16 +288,21 @@ def _season_from_date(date_str):
     try:
         year = int(date_str[:4])
         month = int(date_str[5:7]) if len(date_str) >= 7 else 1
+    except ValueError:
+        return ""
+    key = (year, month)
+    season = _SEASON_CACHE.get(key)
+    if season is None:
         # Cricket season logic:
         #   Aug-Dec: current season spans two years (e.g. "2025/26")
         #   Jan-Apr: belongs to previous season (e.g. "2024/25")
         #   May-Jul: mid-year season, just the year (e.g. "2025")
         if month >= 8:
-            return f"{year}/{str(year + 1)[-2:]}"
+            season = f"{year}/{str(year + 1)[-2:]}"
         else:
-            return f"{year - 1}/{str(year)[-2:]}" if month <= 4 else str(year)
-    except (ValueError, IndexError):
-        return ""
+            season = f"{year - 1}/{str(year)[-2:]}" if month <= 4 else str(year)
+        _SEASON_CACHE[key] = season
+    return season
 
 
 # ============================================================
@@ -174,21 +319,30 @@ def load_csv_cache(csv_path):
     if not path.exists():
         return series
 
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        # Plain reader + header positions: no dict per row, just the entry we keep
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return series
+        positions = {name: i for i, name in enumerate(header)}
+        # (field, column index or None if absent, default when absent)
+        layout = [
+            (field, positions.get(field), _CSV_DEFAULTS.get(field, ""))
+            for field in CSV_FIELDS
+        ]
         for row in reader:
-            sid = row.get("series_id", "").strip().strip('"')
-            if not sid:
-                continue
+            n = len(row)
             entry = {
-                "series_id": sid,
-                "name": row.get("name", "").strip().strip('"'),
-                "url": row.get("url", "").strip().strip('"'),
-                "season": row.get("season", "").strip().strip('"'),
-                "format": row.get("format", "test").strip().strip('"'),
-                "max_innings": row.get("max_innings", "4").strip().strip('"'),
-                "gender": row.get("gender", "").strip().strip('"'),
+                field: (row[i] if i is not None and i < n else default).strip(_CSV_STRIP)
+                for field, i, default in layout
             }
+            sid = entry["series_id"]
+            if not sid:
+                continue
+            # A handful of distinct values across thousands of rows: share them
+            for field in _INTERNED_FIELDS:
+                entry[field] = sys.intern(entry[field])
             # Infer gender from name if not present in CSV
             if not entry["gender"]:
                 entry["gender"] = _infer_gender_from_name(entry["name"])
@@ -197,38 +351,42 @@ def load_csv_cache(csv_path):
     return series
 
 
+# Women's-cricket keywords as one case-insensitive pattern ("women's" is
+# covered by "women")
+_FEMALE_NAME_RE = re.compile(r"women|female|wbbl|wpl|wodi|wt20|w t20|w odi", re.IGNORECASE)
+
+
 def _infer_gender_from_name(name):
     """Infer gender from series name using keyword heuristics."""
-    if not name:
-        return "male"
-    lower = name.lower()
-    female_keywords = ("women", "female", "wbbl", "wpl", "wodi", "wt20",
-                       "women's", "w t20", "w odi")
-    if any(kw in lower for kw in female_keywords):
-        return "female"
-    return "male"
+    return "female" if name and _FEMALE_NAME_RE.search(name) else "male"
 
 
 def merge_series(*sources):
     """Merge multiple series dicts. Earlier sources take precedence; later sources fill gaps.
 
+    Entry dicts are adopted rather than copied (every caller builds fresh ones
+    from load/scan/discovery), so the merged entries are the sources' own
+    objects and gap-filling updates them in place.
+
     Args:
         *sources: dicts keyed by series_id
 
     Returns:
         Merged dict keyed by series_id.
     """
-    merged = {}
-    for source in sources:
+    if not sources:
+        return {}
+    merged = dict(sources[0])
+    for source in sources[1:]:
         for sid, entry in source.items():
-            if sid not in merged:
-                merged[sid] = dict(entry)
-            else:
-                # Later source fills in blanks but doesn't overwrite existing values
-                existing = merged[sid]
-                for key, val in entry.items():
-                    if val and not existing.get(key):
-                        existing[key] = val
+            existing = merged.get(sid)
+            if existing is None:
+                merged[sid] = entry
+                continue
+            # Later source fills in blanks but doesn't overwrite existing values
+            for key, val in entry.items():
+                if val and not existing.get(key):
+                    existing[key] = val
     return merged
 
 
@@ -240,18 +398,26 @@ def write_csv_cache(series, csv_path):
     path = Path(csv_path)
     entries = sorted(series.values(), key=lambda s: int(s.get("series_id", 0)), reverse=True)
 
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, quoting=csv.QUOTE_ALL,
-                                extrasaction="ignore")
-        writer.writeheader()
-        for entry in entries:
-            # Ensure all fields have at least empty string
-            row = {field: entry.get(field, "") for field in CSV_FIELDS}
-            if not row["max_innings"]:
-                row["max_innings"] = str(MAX_INNINGS.get(row.get("format"), 4))
-            if not row["gender"]:
-                row["gender"] = _infer_gender_from_name(row.get("name", ""))
-            writer.writerow(row)
+    rows = []
+    for entry in entries:
+        # Ensure all fields have at least empty string
+        row = [entry.get(field, "") for field in CSV_FIELDS]
+        if not row[_MAX_INNINGS_IDX]:
+            row[_MAX_INNINGS_IDX] = str(MAX_INNINGS.get(row[_FORMAT_IDX], 4))
+        if not row[_GENDER_IDX]:
+            row[_GENDER_IDX] = _infer_gender_from_name(row[_NAME_IDX])
+        rows.append(row)
+
+    # Plain writer over ready-made rows into memory, then one file write.
+    # Atomic write: temp file + rename so a crash never leaves a truncated CSV
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+    writer.writerow(CSV_FIELDS)
+    writer.writerows(rows)
+    tmp_path = path.with_suffix(".csv.tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(buf.getvalue())
+    os.replace(tmp_path, path)
 
 
 def build_series_list(csv_path, cricinfo_dir=None, web_discoveries=None):
@@ -0,0 +1,58 @@
+"""Keep one Chromium running for discover_series.py to attach to over CDP.
+
+Launches the same persistent profile discovery uses, with a remote-debugging
+port open, and stays up until Ctrl+C (or kill_scrapers.py). Discovery runs
+then connect instead of paying a browser cold start each time.
+
+Usage:
+    python scripts/start_browser.py --system-chrome
+    python scripts/discover_series.py --cdp-endpoint http://localhost:9222 --dry-run
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from discover_series import DEFAULT_PROFILE_DIR, launch_options, _load_browser
+
+DEFAULT_CDP_PORT = 9222
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a persistent Chromium that discover_series.py can reuse"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_CDP_PORT,
+        help=f"Remote debugging port (default: {DEFAULT_CDP_PORT})",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=os.environ.get("CRICINFO_PROFILE_DIR", str(DEFAULT_PROFILE_DIR)),
+        help="Browser profile directory (same default as discover_series.py)",
+    )
+    parser.add_argument(
+        "--system-chrome",
+        action="store_true",
+        help="Use system Chrome instead of Playwright's bundled Chromium",
+    )
+    args = parser.parse_args()
+
+    opts = launch_options(args.system_chrome)
+    opts["args"] = opts["args"] + [f"--remote-debugging-port={args.port}"]
+
+    sync_playwright, _ = _load_browser()
+    with sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(str(Path(args.profile_dir)), **opts)
+        print(f"Browser ready: --cdp-endpoint http://localhost:{args.port}  (Ctrl+C to stop)")
+        try:
+            context.wait_for_event("close", timeout=0)
+        except KeyboardInterrupt:
+            context.close()
+
+
+if __name__ == "__main__":
+    main()